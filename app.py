@@ -1,56 +1,26 @@
 import streamlit as st
 import sys
 import os
-import matplotlib.pyplot as plt
+import uuid
+from functools import partial
 
 # Make sure we can import from src/
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from extractor import extract_text_from_pdf
-from nlp import analyze_resume_text
+from budget import TRUNCATION_REASONS
+from cache import cached_extract_with_key, get_default_cache
+from diagnostics import Diagnostics, stage
+from executor import QueueFull, get_executor
+from nlp import extract_resume_features, match_job_description
 from utils import generate_feedback
 from sections import detect_sections
+from document import Document
 from resume_builder import build_resume_template
+from ats import compute_ats_breakdown
+from charts import ats_components_chart, category_counts_chart
 
 
-# ---------- Helper: ATS Breakdown ---------- #
-def compute_ats_breakdown(details, sections):
-    """
-    Compute simple ATS-style component scores.
-    Components: Skills, Keywords, Structure, Length.
-    """
-    word_count = details.get("word_count", 0)
-    num_skills = details.get("num_skills", 0)
-    jd_match = details.get("jd_match_score", 0)
-
-    # Skills: up to 40 points
-    skills_score = min(num_skills * 5, 40)
-
-    # Keywords (JD match): up to 30 points
-    keyword_score = min(jd_match, 30)
-
-    # Structure: based on number of sections detected: up to 20 points
-    num_sections = len([s for s in sections.values() if s.strip()])
-    structure_score = min(num_sections * 4, 20)
-
-    # Length: 0–10 based on ideal word range
-    if 120 <= word_count <= 450:
-        length_score = 10
-    elif 80 <= word_count < 120 or 450 < word_count <= 600:
-        length_score = 6
-    else:
-        length_score = 2
-
-    total = min(skills_score + keyword_score + structure_score + length_score, 100)
-
-    return int(total), {
-        "Skills": int(skills_score),
-        "Keywords": int(keyword_score),
-        "Structure": int(structure_score),
-        "Length": int(length_score),
-    }
-
-
+# ---------- Helper: Quick Suggestions ---------- #
 def build_quick_suggestions(word_count, num_skills, jd_match, ats_score, sections_count):
     suggestions = []
 
@@ -168,6 +138,10 @@ if "analysis" not in st.session_state:
     st.session_state.analysis = None
 if "last_file" not in st.session_state:
     st.session_state.last_file = None
+if "document" not in st.session_state:
+    st.session_state.document = None  # resume-side results for the current upload
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex  # this browser session's turn in the extraction queue
 
 # ---------- Inputs ---------- #
 
@@ -191,14 +165,44 @@ if uploaded_file is not None:
 
 # ---------- Main logic ---------- #
 
+# Set RESUME_DIAGNOSTICS=1 to get per-stage timings and counters in the UI
+SHOW_DIAGNOSTICS = os.environ.get("RESUME_DIAGNOSTICS", "") not in ("", "0")
+
 if uploaded_file is not None:
-    # Extract text
+    diag = Diagnostics() if SHOW_DIAGNOSTICS else None
+
+    # Extract text. New uploads from all sessions share a few extraction slots
+    # (see executor.py), so heavy OCR jobs queue instead of competing for the CPU.
+    queue_note = st.empty()
+
+    def show_queue_position(ahead):
+        queue_note.info(f"⏳ Server busy: your resume is #{ahead + 1} in the queue, extraction starts shortly.")
+
     with st.spinner("Extracting text from resume..."):
         try:
-            resume_text, ocr_used, pages = extract_text_from_pdf(uploaded_file)
+            with stage(diag, "extract"):
+                doc_key, (resume_text, ocr_used, pages, truncated) = cached_extract_with_key(
+                    uploaded_file, diagnostics=diag,
+                    runner=partial(get_executor().run, st.session_state.session_id, on_wait=show_queue_position),
+                )
+        except QueueFull:
+            st.error("The server is busy analysing other resumes. Please try again in a minute.")
+            st.stop()
         except Exception as e:
             st.error(f"Error extracting text: {e}")
             st.stop()
+    queue_note.empty()
+
+    # Sections and resume features are computed once per document (by the extraction
+    # cache key); reruns and JD edits reuse them, so Analyze only pays for the JD match.
+    document = st.session_state.document
+    if document is None or document["key"] != doc_key:
+        with stage(diag, "detect_sections"):
+            resume = Document(resume_text)
+            document = {"key": doc_key, "resume": resume, "sections": detect_sections(resume), "features": None}
+        st.session_state.document = document
+    resume = document["resume"]
+    sections = document["sections"]
 
     # Top row: extraction + length
     top1, top2 = st.columns(2)
@@ -211,10 +215,13 @@ if uploaded_file is not None:
             st.warning("OCR was used (scanned/image-based PDF detected).")
         else:
             st.success("Extracted text directly (text-based PDF).")
+        if truncated:
+            st.warning(f"Extraction stopped early ({TRUNCATION_REASONS.get(truncated, truncated)}); "
+                       "the analysis uses the text read until then.")
         st.markdown('</div>', unsafe_allow_html=True)
 
     with top2:
-        word_count = len(resume_text.split())
+        word_count = resume.word_count
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Resume Length Check</div>', unsafe_allow_html=True)
         st.write(f"Total words: **{word_count}**")
@@ -239,7 +246,6 @@ if uploaded_file is not None:
     with mid2:
         st.markdown('<div class="card">', unsafe_allow_html=True)
         st.markdown('<div class="section-title">Detected Resume Sections</div>', unsafe_allow_html=True)
-        sections = detect_sections(resume_text)
         if sections:
             for sec_name, sec_content in sections.items():
                 with st.expander(f"📂 {sec_name}"):
@@ -252,9 +258,15 @@ if uploaded_file is not None:
     if st.button("🔍 Analyze Resume"):
         with st.spinner("Running analysis..."):
             try:
-                skills, score, details = analyze_resume_text(resume_text, job_description)
-                feedback = generate_feedback(skills, score, details)
-                ats_score, ats_components = compute_ats_breakdown(details, sections)
+                if document["features"] is None:
+                    with stage(diag, "extract_resume_features"):
+                        document["features"] = extract_resume_features(resume)
+                with stage(diag, "match_job_description"):
+                    skills, score, details = match_job_description(document["features"], job_description)
+                with stage(diag, "generate_feedback"):
+                    feedback = generate_feedback(skills, score, details, resume)
+                with stage(diag, "compute_ats_breakdown"):
+                    ats_score, ats_components = compute_ats_breakdown(details, sections)
             except Exception as e:
                 st.error(f"Error analyzing resume: {e}")
                 st.stop()
@@ -376,15 +388,7 @@ if uploaded_file is not None:
 
             st.metric("Overall ATS Score", f"{ats_score} / 100")
 
-            labels = list(ats_components.keys())
-            values = list(ats_components.values())
-
-            fig, ax = plt.subplots()
-            ax.bar(labels, values, color=["#3b82f6", "#22c55e", "#f97316", "#a855f7"])
-            ax.set_ylim(0, 100)
-            ax.set_ylabel("Score (0–100)")
-            ax.set_title("ATS Component Scores")
-            st.pyplot(fig)
+            st.image(ats_components_chart(ats_components))
 
             st.markdown("**What this means:**")
             st.write(
@@ -406,11 +410,7 @@ if uploaded_file is not None:
                 st.markdown("**Skill Categories**")
                 cat_counts = details.get("category_counts", {})
                 if cat_counts:
-                    fig2, ax2 = plt.subplots()
-                    ax2.bar(cat_counts.keys(), cat_counts.values(), color="#0ea5e9")
-                    ax2.set_ylabel("Count")
-                    ax2.set_title("Detected Skill Categories")
-                    st.pyplot(fig2)
+                    st.image(category_counts_chart(cat_counts))
                 else:
                     st.info("No skills available to show category chart.")
 
@@ -423,5 +423,10 @@ if uploaded_file is not None:
 
             st.markdown('</div>', unsafe_allow_html=True)
 
+    # ----- DIAGNOSTICS ----- #
+    if diag is not None:
+        with st.expander("🛠️ Diagnostics (this run)"):
+            st.json({**diag.to_dict(), "extraction_cache": get_default_cache().stats()})
+
 else:
     st.info("👆 Upload a PDF resume to get started.")
@@ -0,0 +1,501 @@
+"""
+Headless batch analysis of many resume PDFs.
+
+    python batch.py run resumes/ -o results.jsonl --workers 8
+    python batch.py run --manifest files.txt -o results.jsonl --jd job.txt
+    python batch.py run resumes/ -o results.jsonl --index resumes.idx
+    python batch.py search --index resumes.idx --jd job.txt -k 10
+    python batch.py run resumes/ -o results.jsonl --metrics metrics.prom
+    python batch.py rescore results.jsonl -o rescored.jsonl --weights weights.json
+    python batch.py match results.jsonl --jd job.txt -o matched.jsonl
+    python batch.py run resumes/ -o results.jsonl --dedup seen.db
+    python batch.py duplicates seen.db
+    python batch.py export-templates results.jsonl templates.zip
+    python batch.py run resumes/ -o results.jsonl --store results.db
+    python batch.py stats results.db
+
+Each PDF is processed on a worker process and written as one JSON line.
+A PDF that fails is recorded with "ok": false and the run keeps going.
+With --dedup, a PDF already seen (same bytes or near-duplicate text) is
+recorded with "duplicate_of" instead of being analysed again.
+With --store, finished documents are kept in a results database and a
+restarted run skips them (and appends to its JSONL output).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+# Make sure we can import from src/ (also in spawned worker processes)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from pipeline import analyze_pdf
+from nlp import ResumeFeatures, match_job_description
+from ats import compute_ats_breakdown
+from index import ResumeIndex
+from diagnostics import MetricsSummary
+from resume_builder import STYLES, export_templates, iter_template_inputs
+from store import ResultsStore, job_key
+
+
+def iter_input_paths(directory=None, manifest=None, recursive=False):
+    """Yield PDF paths from a directory walk or from a manifest (one path per line)."""
+    if manifest:
+        with open(manifest, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+        return
+
+    if recursive:
+        for root, dirs, files in os.walk(directory):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    yield os.path.join(root, name)
+    else:
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if name.lower().endswith(".pdf") and os.path.isfile(path):
+                yield path
+
+
+def _init_worker():
+    """
+    Pool initializer: records go back to the parent, which may be writing
+    JSONL to stdout, so anything a worker prints (extractor diagnostics,
+    PyMuPDF's own warnings, which bind to stdout on import) goes to stderr.
+    """
+    sys.stdout = sys.stderr
+
+
+def run_batch(paths, out, workers=None, job_description=None, ocr_workers=0,
+              index=None, metrics=None, keep_diagnostics=False, dedup=None,
+              store=None, log=sys.stderr, log_every=50):
+    """
+    Analyse every path on a process pool and write one JSON line per resume to `out`.
+    At most 2 * workers documents are in flight, so memory stays bounded
+    however long `paths` is. If `index` (a ResumeIndex) is given, every
+    analysed resume is also added to it. If `metrics` (a MetricsSummary) is
+    given, per-document diagnostics are collected into it; keep_diagnostics
+    also writes them into each JSONL record. If `dedup` (a dedup.DedupIndex)
+    is given, workers skip documents already in it and every new signature is
+    added to it (duplicates inside one run are caught once the first copy is
+    stored). If `store` (a store.ResultsStore) is given, paths it already
+    holds a successful result for (same size, mtime and job description) are
+    skipped and every new record is added to it in bulk. Returns
+    (documents, failures, seconds); skipped paths are not counted.
+    """
+    collect = metrics is not None or keep_diagnostics
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+    done_count = 0
+    failed = 0
+    duplicates = 0
+    already_done = 0
+    file_stats = {}
+    isolated = set()  # paths already retried alone after a worker died
+    store_key = job_key(job_description) if store is not None else None
+    start = time.perf_counter()
+
+    def report(final=False):
+        elapsed = time.perf_counter() - start
+        rate = done_count / elapsed if elapsed > 0 else 0.0
+        prefix = "done" if final else "progress"
+        skipped = f", {duplicates} duplicates" if dedup is not None else ""
+        if store is not None:
+            skipped += f", {already_done} already done"
+        print(f"[{prefix}] {done_count} documents, {failed} failed{skipped}, "
+              f"{elapsed:.1f}s, {rate:.2f} docs/sec", file=log)
+
+    def handle(record):
+        nonlocal done_count, failed, duplicates
+        text = record.pop("text", None)
+        signature = record.pop("signature", None)
+        if dedup is not None and signature is not None:
+            dedup.add(record["path"], signature, record.get("content_hash"))
+        if metrics is not None:
+            metrics.add(record.get("diagnostics", {}), ok=record["ok"])
+        if not keep_diagnostics:
+            record.pop("diagnostics", None)
+        if not record["ok"]:
+            failed += 1
+        elif "duplicate_of" in record:
+            duplicates += 1
+        elif index is not None:
+            index.add(record["path"], text, record["skills"],
+                      meta={"score": record["score"], "ats_score": record["ats_score"]},
+                      commit=False)
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if store is not None:
+            out.flush()  # the line must be on disk before the store commits its row
+            store.add(record, store_key, file_stats.pop(record["path"], None))
+        done_count += 1
+        if log_every and done_count % log_every == 0:
+            if index is not None:
+                index.commit()
+            report()
+
+    def submit(pool, path):
+        return pool.submit(
+            analyze_pdf, path, job_description, ocr_workers, index is not None, collect,
+            dedup.path if dedup is not None else None,
+            store.path if store is not None else None,
+        )
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        pending = {}          # future -> path
+        suspects = deque()    # in flight when a worker died: retried one at a time
+        path_iter = iter(paths)
+        exhausted = False
+
+        while pending or suspects or not exhausted:
+            if suspects:
+                if not pending:
+                    path = suspects.popleft()
+                    pending[submit(pool, path)] = path
+            while not suspects and not exhausted and len(pending) < max_in_flight:
+                try:
+                    path = next(path_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if store is not None:
+                    try:
+                        file_stats[path] = os.stat(path)
+                    except OSError:
+                        file_stats[path] = None  # the worker reports the error
+                    if file_stats[path] is not None and store.is_done(path, store_key, file_stats[path]):
+                        del file_stats[path]
+                        already_done += 1
+                        continue
+                pending[submit(pool, path)] = path
+
+            if not pending:
+                continue
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in finished:
+                path = pending.pop(future)
+                try:
+                    record = future.result()
+                except BrokenProcessPool as e:
+                    # a worker died (crash, OOM kill). Alone in the pool, this path is
+                    # the cause; otherwise any path in flight may be, so retry them alone.
+                    broken = True
+                    if pending or len(finished) > 1 or path not in isolated:
+                        suspects.append(path)
+                        isolated.add(path)
+                        continue
+                    record = {"path": path, "ok": False, "has_job_description": bool(job_description),
+                              "error": f"{type(e).__name__}: worker process died analysing this file"}
+                handle(record)
+            if broken:
+                suspects.extend(pending.values())
+                isolated.update(pending.values())
+                pending = {}
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    finally:
+        pool.shutdown(cancel_futures=True)
+        # keep what finished, also when the run is interrupted
+        if index is not None:
+            index.commit()
+        out.flush()
+        if store is not None:
+            store.flush()
+
+    report(final=True)
+    return done_count, failed, time.perf_counter() - start
+
+
+def compact_output(path, store, key):
+    """
+    Prepare the JSONL output of an interrupted --store run for appending:
+    keep the last line of each file the store has committed (and the resumed
+    run will skip), drop the rest. Lines written after the store's last
+    commit (the run was killed), failures and a torn last line go, since
+    those files are analysed again and appended. Returns the lines kept.
+    """
+    last = {}
+    with open(path, "rb") as f:
+        for number, line in enumerate(f):
+            try:
+                last[json.loads(line)["path"]] = number
+            except (ValueError, KeyError, TypeError):
+                pass  # e.g. half a line from a killed run
+
+    keep = {}
+    for file_path, number in last.items():
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            continue
+        if store.is_done(file_path, key, stat):
+            keep[number] = file_path
+
+    tmp_path = path + ".tmp"
+    with open(path, "rb") as src, open(tmp_path, "wb") as dst:
+        for number, line in enumerate(src):
+            if number in keep:
+                dst.write(line if line.endswith(b"\n") else line + b"\n")
+    os.replace(tmp_path, path)
+    return len(keep)
+
+
+def _read_job_description(path):
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def cmd_run(args):
+    if not args.directory and not args.manifest:
+        print("error: give a directory or --manifest", file=sys.stderr)
+        return 2
+
+    paths = iter_input_paths(args.directory, args.manifest, args.recursive)
+    job_description = _read_job_description(args.jd)
+    index = ResumeIndex(args.index) if args.index else None
+    metrics = MetricsSummary() if args.metrics else None
+    dedup = None
+    if args.dedup:
+        from dedup import DedupIndex  # numpy is only needed with --dedup
+
+        dedup = DedupIndex(args.dedup)
+    store = ResultsStore(args.store) if args.store else None
+    options = dict(
+        workers=args.workers, job_description=job_description, ocr_workers=args.ocr_workers,
+        index=index, metrics=metrics, keep_diagnostics=args.diagnostics, dedup=dedup, store=store,
+    )
+
+    try:
+        if args.output == "-":
+            run_batch(paths, sys.stdout, **options)
+        else:
+            # a resumed run continues the same output file, without the lines
+            # of files it is about to analyse again
+            if store is not None and os.path.exists(args.output):
+                kept = compact_output(args.output, store, job_key(job_description))
+                print(f"[resume] {kept} finished records kept in {args.output}", file=sys.stderr)
+            with open(args.output, "a" if store is not None else "w", encoding="utf-8") as out:
+                run_batch(paths, out, **options)
+    finally:
+        if index is not None:
+            index.close()
+        if dedup is not None:
+            dedup.close()
+        if store is not None:
+            store.close()
+
+    if metrics is not None:
+        prometheus = args.metrics.endswith((".prom", ".txt"))
+        with open(args.metrics, "w", encoding="utf-8") as f:
+            f.write(metrics.to_prometheus() if prometheus else metrics.to_json())
+    return 0
+
+
+def iter_records(path):
+    """Records of a JSONL results file, one at a time."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _analysed(record):
+    # ok records skipped as duplicates have no analysis to work from
+    return record.get("ok") and "details" in record
+
+
+def cmd_rescore(args):
+    # numpy is only needed for this command
+    from scoring import features_from_records, score_batch
+
+    weights = None
+    if args.weights:
+        with open(args.weights, encoding="utf-8") as f:
+            weights = json.load(f)
+
+    start = time.perf_counter()
+    paths = [r["path"] for r in iter_records(args.results) if _analysed(r)]
+    features = features_from_records(iter_records(args.results))
+    scores = score_batch(**features, weights=weights)
+    elapsed = time.perf_counter() - start
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        columns = {name: values.tolist() for name, values in scores.items()}
+        for i, path in enumerate(paths):
+            out.write(json.dumps({"path": path, **{k: v[i] for k, v in columns.items()}}) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"[rescore] {len(paths)} resumes in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_match(args):
+    """Match stored results against a new JD; only the JD side is recomputed."""
+    job_description = _read_job_description(args.jd)
+    start = time.perf_counter()
+    matched = 0
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        for record in iter_records(args.results):
+            if _analysed(record):
+                details = record["details"]
+                features = ResumeFeatures(record["skills"], details["category_counts"], details["word_count"])
+                skills, score, details = match_job_description(features, job_description)
+                ats_score, ats_components = compute_ats_breakdown(details, record.get("sections", {}))
+                record.update({
+                    "has_job_description": bool(job_description),
+                    "skills": skills,
+                    "score": score,
+                    "details": details,
+                    "ats_score": ats_score,
+                    "ats_components": ats_components,
+                })
+                matched += 1
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"[match] {matched} resumes in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_duplicates(args):
+    from dedup import DedupIndex
+
+    with DedupIndex(args.db, readonly=True) as dedup:
+        start = time.perf_counter()
+        groups = dedup.groups()
+        elapsed = time.perf_counter() - start
+        total = len(dedup)
+
+    for group in groups:
+        print(json.dumps({"size": len(group), "paths": group}, ensure_ascii=False))
+    print(f"[duplicates] {len(groups)} groups among {total} documents in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_stats(args):
+    """Score distributions and skill frequencies from a --store database."""
+    with ResultsStore(args.db, readonly=True) as store:
+        key = job_key(_read_job_description(args.jd)) if args.jd else store.last_job_key()
+        start = time.perf_counter()
+        stats = {
+            "job_key": key,
+            "summary": store.summary(key),
+            "score": store.histogram("score", key, bins=args.bins),
+            "ats_score": store.histogram("ats_score", key, bins=args.bins),
+            "top_skills": [{"skill": skill, "documents": n}
+                           for skill, n in store.skill_frequencies(key, top=args.top)],
+        }
+        elapsed = time.perf_counter() - start
+    print(json.dumps(stats, indent=2, ensure_ascii=False))
+    print(f"[stats] {stats['summary']['documents']} documents in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+def cmd_export_templates(args):
+    """Stream resume templates for every analysed record of a results file into a ZIP."""
+    start = time.perf_counter()
+    dest = sys.stdout.buffer if args.output == "-" else args.output
+    count = export_templates(iter_template_inputs(iter_records(args.results)), dest, styles=args.styles)
+    print(f"[export-templates] {count} resumes x {len(args.styles)} styles in "
+          f"{time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_search(args):
+    job_description = _read_job_description(args.jd)
+    with ResumeIndex(args.index) as index:
+        start = time.perf_counter()
+        results = index.search(job_description, k=args.top)
+        elapsed = time.perf_counter() - start
+
+    for rank, (score, key, meta) in enumerate(results, 1):
+        print(json.dumps({"rank": rank, "bm25": score, "path": key, **meta}, ensure_ascii=False))
+    print(f"[search] {len(results)} results in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Batch resume analysis (no browser needed).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Analyse a directory or manifest of PDFs into JSONL.")
+    run.add_argument("directory", nargs="?", help="Directory containing PDF resumes.")
+    run.add_argument("--manifest", help="Text file with one PDF path per line.")
+    run.add_argument("-r", "--recursive", action="store_true", help="Walk sub-directories too.")
+    run.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout).")
+    run.add_argument("-w", "--workers", type=int, default=None,
+                     help="Worker processes (default: CPU count).")
+    run.add_argument("--ocr-workers", type=int, default=0,
+                     help="OCR threads per document for scanned PDFs (default: sequential).")
+    run.add_argument("--jd", help="Text file with a job description to match against.")
+    run.add_argument("--index", help="Also add every analysed resume to this search index file.")
+    run.add_argument("--diagnostics", action="store_true",
+                     help="Include per-stage timings and counters in every JSONL record.")
+    run.add_argument("--metrics", help="Write run totals here (Prometheus text for .prom/.txt, else JSON).")
+    run.add_argument("--dedup", help="Near-duplicate database: skip documents already in it, add new ones.")
+    run.add_argument("--store", help="Results database: skip documents already finished, add new results.")
+    run.set_defaults(func=cmd_run)
+
+    rescore = sub.add_parser("rescore", help="Recompute scores of a results file without re-extraction.")
+    rescore.add_argument("results", help="JSONL file written by run.")
+    rescore.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout).")
+    rescore.add_argument("--weights", help="JSON file overriding scoring.DEFAULT_WEIGHTS entries.")
+    rescore.set_defaults(func=cmd_rescore)
+
+    match = sub.add_parser("match", help="Re-match a results file against a job description.")
+    match.add_argument("results", help="JSONL file written by run.")
+    match.add_argument("--jd", required=True, help="Text file with the job description.")
+    match.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout).")
+    match.set_defaults(func=cmd_match)
+
+    duplicates = sub.add_parser("duplicates", help="List near-duplicate groups of a --dedup database.")
+    duplicates.add_argument("db", help="Database written by run --dedup.")
+    duplicates.set_defaults(func=cmd_duplicates)
+
+    stats = sub.add_parser("stats", help="Score distributions and skill frequencies of a --store database.")
+    stats.add_argument("db", help="Database written by run --store.")
+    stats.add_argument("--jd", help="Job description the results were scored against (default: the last run's).")
+    stats.add_argument("--bins", type=int, default=10, help="Histogram bins over 0-100 (default: 10).")
+    stats.add_argument("--top", type=int, default=20, help="Number of skills to list (default: 20).")
+    stats.set_defaults(func=cmd_stats)
+
+    export = sub.add_parser("export-templates", help="Write resume templates for a results file into a ZIP.")
+    export.add_argument("results", help="JSONL file written by run.")
+    export.add_argument("output", help="ZIP file to write ('-' for stdout).")
+    export.add_argument("--styles", nargs="+", choices=STYLES, default=list(STYLES),
+                        help="Template styles to include (default: all).")
+    export.set_defaults(func=cmd_export_templates)
+
+    search = sub.add_parser("search", help="Rank indexed resumes against a job description.")
+    search.add_argument("--index", required=True, help="Index file built with run --index.")
+    search.add_argument("--jd", required=True, help="Text file with the job description.")
+    search.add_argument("-k", "--top", type=int, default=10, help="Number of candidates to return.")
+    search.set_defaults(func=cmd_search)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
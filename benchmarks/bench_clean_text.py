@@ -0,0 +1,99 @@
+"""
+clean_text: golden-corpus equality check + timing against the original
+multi-pass implementation.
+
+    python benchmarks/bench_clean_text.py
+    python benchmarks/bench_clean_text.py --corpus benchmarks/corpus   # add raw PDF text
+
+Exits 1 if the current clean_text differs from the original on any input.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "src"))
+sys.path.append(HERE)
+
+from extractor import clean_text
+
+
+def legacy_clean_text(text: str) -> str:
+    """clean_text as it was before the fused-regex rewrite (the golden reference)."""
+    text = re.sub(r"[^A-Za-z0-9.,;:@/\-\n\s()&%+*]+", " ", text)
+    text = re.sub(r"\n+", "\n", text)
+    text = re.sub(r"\s{2,}", " ", text)
+    replacements = {
+        " ,": ",", " .": ".", " - ": "-", "–": "-", "—": "-", "…": "", "•": "",
+        "§": "", "ï": "", "’": "'", "ﬁ": "fi", "ﬂ": "fl",
+    }
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    text = re.sub(r"\bUnivers\.*\b", "University", text, flags=re.IGNORECASE)
+    return text.strip()
+
+
+# Pieces that exercise every rule, including their interactions
+PIECES = [
+    " ", "  ", "\n", "\n\n", "\t", "\r\n", "\f", " ", " ", " , ", " . ", " - ", " -,", "-",
+    "–", "—", "…", "•", "§", "ï", "’", "ﬁ", "ﬂ", "é", "✓", "🚀", "_", "#", "|", "[", "]",
+    "Univers", "Univers.", "Univers...", "UNIVERS", "University", "Universe", "Anna Univers",
+    "Python", "C++", "Node.js", "B.Tech", "user@example.com", "+91 98765", "(2021-2024)", "80%",
+]
+
+
+def golden_corpus(seed=7, n=20000):
+    rng = random.Random(seed)
+    docs = ["".join(rng.choice(PIECES) for _ in range(rng.randint(0, 40))) for _ in range(n)]
+    # a few long, resume-sized documents
+    for _ in range(50):
+        docs.append("".join(rng.choice(PIECES) + rng.choice(("", " ", "\n")) for _ in range(4000)))
+    return docs
+
+
+def pdf_corpus(directory):
+    from extractor import iter_pdf_pages
+
+    docs = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".pdf"):
+            with open(os.path.join(directory, name), "rb") as f:
+                docs.append("".join(p.text + "\n\n" for p in iter_pdf_pages(f)))
+    return docs
+
+
+def timed(fn, docs):
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of PDFs whose raw text joins the golden corpus.")
+    args = parser.parse_args(argv)
+
+    docs = golden_corpus()
+    if args.corpus:
+        docs += pdf_corpus(args.corpus)
+
+    mismatches = [d for d in docs if clean_text(d) != legacy_clean_text(d)]
+    if mismatches:
+        print(f"MISMATCH on {len(mismatches)} of {len(docs)} inputs, first: {mismatches[0]!r}", file=sys.stderr)
+        return 1
+
+    chars = sum(len(d) for d in docs)
+    old = timed(legacy_clean_text, docs)
+    new = timed(clean_text, docs)
+    print(f"{len(docs)} documents, {chars / 1e6:.1f} M chars: identical output")
+    print(f"original   {old:.3f}s  ({chars / old / 1e6:.1f} M chars/s)")
+    print(f"fused      {new:.3f}s  ({chars / new / 1e6:.1f} M chars/s)  {old / new:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Near-duplicate detection at growing corpus sizes.
+
+    python benchmarks/bench_dedup.py                  # 1k, 5k, 20k documents
+    python benchmarks/bench_dedup.py --sizes 1000 100000 --seed 3
+
+Each corpus is synthetic resume-length text where 10% of documents are lightly
+edited copies (2% of words replaced) of another document. Reports time to
+sign + store all documents, time to group them, and recall/precision of the
+groups against the planted duplicates. Time per document should stay flat.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from dedup import DedupIndex
+
+WORDS_PER_DOC = 500
+
+
+def make_corpus(n, rng):
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 10)))
+             for _ in range(20000)]
+    docs, planted = [], set()
+    for i in range(n):
+        if docs and rng.random() < 0.1:
+            source = rng.randrange(len(docs))
+            words = docs[source].split()
+            for _ in range(len(words) // 50):
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+            planted.add((source, i))
+        else:
+            words = [rng.choice(vocab) for _ in range(WORDS_PER_DOC)]
+        docs.append(" ".join(words))
+    return docs, planted
+
+
+def run(n, seed=7):
+    docs, planted = make_corpus(n, random.Random(seed))
+    with tempfile.TemporaryDirectory() as tmp:
+        with DedupIndex(os.path.join(tmp, "dedup.db")) as dedup:
+            start = time.perf_counter()
+            for i, text in enumerate(docs):
+                dedup.add(str(i), dedup.signature(text), commit=False)
+            dedup.commit()
+            add_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            groups = dedup.groups()
+            group_s = time.perf_counter() - start
+
+    group_of = {int(key): g for g, members in enumerate(groups) for key in members}
+    found = sum(1 for a, b in planted if a in group_of and group_of.get(a) == group_of.get(b))
+    grouped_pairs = sum(len(g) - 1 for g in groups)
+    recall = found / len(planted) if planted else 1.0
+    precision = found / grouped_pairs if grouped_pairs else 1.0
+    print(f"{n:>8} {add_s:>8.2f} {add_s / n * 1000:>8.3f} {group_s:>8.2f} {recall:>7.3f} {precision:>9.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 5000, 20000], help="corpus sizes to run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    print(f"{'docs':>8} {'add s':>8} {'ms/doc':>8} {'group s':>8} {'recall':>7} {'precision':>9}")
+    for n in args.sizes:
+        run(n, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
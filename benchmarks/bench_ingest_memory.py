@@ -0,0 +1,104 @@
+"""
+Peak Python-heap memory per document for the three ways a PDF enters the pipeline.
+
+    python benchmarks/bench_ingest_memory.py                     # largest corpus PDFs
+    python benchmarks/bench_ingest_memory.py big.pdf other.pdf
+    python benchmarks/bench_ingest_memory.py -o new.json --compare old.json
+
+Entry points, each run on every document:
+    batch    pipeline.analyze_pdf(path)                          (batch.py workers)
+    service  pipeline.analyze_pdf_bytes(data)                    (service.py)
+    app      cache.cached_extract_text_from_pdf(BytesIO upload)  (Streamlit)
+
+Peaks are measured with tracemalloc, so they count copies of the PDF bytes made
+in Python, not MuPDF's own allocations. "copies" is peak / file size. The
+upload itself (service, app) exists before measuring starts and is not counted.
+--no-ocr skips OCR so scanned pages can be measured without the tesseract binary.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "src"))
+sys.path.append(HERE)
+
+import extractor
+from cache import ExtractionCache, cached_extract_text_from_pdf
+from pipeline import analyze_pdf, analyze_pdf_bytes
+
+MB = 1024 * 1024
+
+ENTRY_POINTS = {
+    "batch": lambda path, data: analyze_pdf(path),
+    "service": lambda path, data: analyze_pdf_bytes(data),
+    "app": lambda path, data: cached_extract_text_from_pdf(io.BytesIO(data), cache=ExtractionCache(1)),
+}
+
+
+def peak_bytes(func) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def default_documents(count):
+    corpus = os.path.join(HERE, "corpus")
+    if not os.path.exists(os.path.join(corpus, "manifest.json")):
+        from corpus import generate_corpus
+
+        print(f"generating corpus in {corpus} ...", file=sys.stderr)
+        generate_corpus(corpus)
+    paths = [os.path.join(corpus, name) for name in os.listdir(corpus) if name.endswith(".pdf")]
+    return sorted(paths, key=os.path.getsize, reverse=True)[:count]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdfs", nargs="*", help="PDFs to measure (default: the largest corpus PDFs).")
+    parser.add_argument("--count", type=int, default=4, help="Corpus PDFs to use when none are given.")
+    parser.add_argument("--no-ocr", action="store_true", help="Never OCR (measures ingestion only).")
+    parser.add_argument("-o", "--output", default=os.path.join(HERE, "results", "ingest_memory.json"))
+    parser.add_argument("--compare", help="Earlier results JSON to compare peaks against.")
+    args = parser.parse_args(argv)
+
+    if args.no_ocr:
+        extractor.OCR_MIN_CHARS = 0
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = {(r["file"], r["entry"]): r for r in json.load(f)["documents"]}
+
+    rows = []
+    print(f"{'file':<28} {'size MB':>8} {'entry':<8} {'peak MB':>8} {'copies':>7}")
+    for path in args.pdfs or default_documents(args.count):
+        with open(path, "rb") as f:
+            data = f.read()
+        size = len(data)
+        for entry, run in ENTRY_POINTS.items():
+            peak = peak_bytes(lambda: run(path, data))
+            row = {"file": os.path.basename(path), "entry": entry, "size_bytes": size,
+                   "peak_bytes": peak, "copies": round(peak / size, 2) if size else None}
+            rows.append(row)
+            line = f"{row['file']:<28} {size / MB:>8.2f} {entry:<8} {peak / MB:>8.2f} {row['copies'] or 0:>7.2f}"
+            old = previous.get((row["file"], entry))
+            if old and old["peak_bytes"]:
+                line += f"   was {old['peak_bytes'] / MB:.2f} MB ({peak / old['peak_bytes']:.2f}x)"
+            print(line, flush=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"no_ocr": args.no_ocr, "documents": rows}, f, indent=2)
+    print(f"\nwrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
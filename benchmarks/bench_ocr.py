@@ -0,0 +1,102 @@
+"""
+Per-page OCR latency for each OCR backend.
+
+    python benchmarks/bench_ocr.py                     # 10 scanned pages, every backend
+    python benchmarks/bench_ocr.py --pages 30 --threads 4 --backends tesserocr
+
+Renders the pages of a synthetic scanned resume (benchmarks/corpus.py) once,
+then OCRs the same images with each backend: pytesseract starts a tesseract
+process per page, tesserocr reuses engines that loaded the model once.
+Reports the time to create the backend, the first (warm-up) call on its
+own, then mean/p50/p95 seconds per page and pages per second over every
+page, and whether the text matches the first backend's.
+Backends that are not installed are skipped.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "src"))
+sys.path.append(HERE)
+
+from corpus import DENSITIES, build_pdf
+from extractor import PytesseractBackend, TesserocrBackend, _prepare_page
+from stats import percentile
+
+BACKENDS = {"pytesseract": PytesseractBackend, "tesserocr": TesserocrBackend}
+
+
+def render_pages(n_pages, seed):
+    """PIL images of a scanned PDF's pages, as the extractor would OCR them."""
+    import fitz  # PyMuPDF
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scanned.pdf")
+        build_pdf(path, "scanned", n_pages, DENSITIES["small"], random.Random(seed))
+        with fitz.open(path) as doc:
+            return [_prepare_page(page, None)[1] for page in doc]
+
+
+def run_backend(backend, images, threads):
+    """(texts, per-page seconds, wall seconds) for OCR-ing every image."""
+    def timed(image):
+        start = time.perf_counter()
+        text = backend.image_to_string(image)
+        return text, time.perf_counter() - start
+
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results = list(pool.map(timed, images))
+    else:
+        results = [timed(image) for image in images]
+    wall = time.perf_counter() - start
+    return [text for text, _ in results], [seconds for _, seconds in results], wall
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--threads", type=int, default=1, help="OCR pages on this many threads")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args(argv)
+
+    images = [image for image in render_pages(args.pages, args.seed) if image is not None]
+    print(f"{len(images)} scanned pages, {args.threads} thread(s)")
+    print(f"{'backend':>12} {'load s':>8} {'first s':>8} {'mean s':>8} {'p50 s':>8} {'p95 s':>8} {'pages/s':>8}"
+          f"  same text")
+
+    reference = None
+    ran = 0
+    for name in args.backends:
+        try:
+            start = time.perf_counter()
+            backend = BACKENDS[name]()
+            load = time.perf_counter() - start
+            start = time.perf_counter()
+            backend.image_to_string(images[0])  # pytesseract only finds a missing binary here
+            first = time.perf_counter() - start
+        except Exception as e:
+            print(f"{name:>12}  skipped: {type(e).__name__}: {e}")
+            continue
+
+        texts, seconds, wall = run_backend(backend, images, args.threads)
+        seconds.sort()
+        if reference is None:
+            reference, same = texts, "-"
+        else:
+            same = f"{sum(a == b for a, b in zip(texts, reference))}/{len(texts)}"
+        print(f"{name:>12} {load:8.3f} {first:8.3f} {sum(seconds) / len(seconds):8.3f} {percentile(seconds, 50):8.3f}"
+              f" {percentile(seconds, 95):8.3f} {len(images) / wall:8.2f}  {same}")
+        ran += 1
+    return 0 if ran else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+End-to-end pipeline benchmark on the synthetic corpus.
+
+    python benchmarks/bench_pipeline.py                        # builds benchmarks/corpus if missing
+    python benchmarks/bench_pipeline.py --kinds text --repeat 3
+    python benchmarks/bench_pipeline.py -o new.json --compare old.json
+
+Times every stage per document (text extraction, clean_text, detect_sections,
+analyze_resume_text, compute_ats_breakdown, build_resume_template) and reports
+throughput, p50/p95 latency and peak RSS. Results are written as JSON so runs
+can be compared over time. Scanned pages need the tesseract binary.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "src"))
+sys.path.append(HERE)
+
+from corpus import KINDS, generate_corpus, load_manifest
+from diagnostics import Diagnostics
+from extractor import extract_text_from_pdf
+from sections import detect_sections
+from stats import percentile
+from nlp import analyze_resume_text
+from ats import compute_ats_breakdown
+from resume_builder import build_resume_template
+
+STAGES = [
+    "extract_pages", "clean_text", "extract_text_from_pdf", "detect_sections",
+    "analyze_resume_text", "compute_ats_breakdown", "build_resume_template", "total",
+]
+TEMPLATE_STYLES = ["Modern", "Minimal", "ATS-friendly"]
+
+JOB_DESCRIPTION = (
+    "We are hiring a backend engineer with Python, SQL, Docker and AWS experience. "
+    "Machine learning, communication and teamwork are a plus."
+)
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_document(path):
+    """Run every stage on one PDF; returns {stage: seconds}."""
+    timings = {}
+    clock = time.perf_counter
+
+    # the production extractor (default budget, OCR triage, truncation); its own
+    # diagnostics split the time into page extraction and clean_text
+    diag = Diagnostics()
+    start = clock()
+    text = extract_text_from_pdf(path, diagnostics=diag).text
+    timings["extract_text_from_pdf"] = clock() - start
+    timings["extract_pages"] = diag.timings["extract_pages"]
+    timings["clean_text"] = diag.timings["clean_text"]
+
+    start = clock()
+    sections = detect_sections(text)
+    timings["detect_sections"] = clock() - start
+
+    start = clock()
+    skills, score, details = analyze_resume_text(text, JOB_DESCRIPTION)
+    timings["analyze_resume_text"] = clock() - start
+
+    start = clock()
+    compute_ats_breakdown(details, sections)
+    timings["compute_ats_breakdown"] = clock() - start
+
+    start = clock()
+    for style in TEMPLATE_STYLES:
+        build_resume_template(sections, skills, style=style)
+    timings["build_resume_template"] = clock() - start
+
+    timings["total"] = sum(timings[s] for s in STAGES[:-1] if s not in ("extract_pages", "clean_text"))
+    return timings
+
+
+def summarise(samples):
+    """{stage: [seconds]} -> {stage: stats}"""
+    summary = {}
+    for stage in STAGES:
+        values = sorted(samples.get(stage, []))
+        if not values:
+            continue
+        total = sum(values)
+        summary[stage] = {
+            "count": len(values),
+            "total_s": round(total, 6),
+            "docs_per_sec": round(len(values) / total, 3) if total > 0 else None,
+            "mean_ms": round(total / len(values) * 1000, 4),
+            "p50_ms": round(percentile(values, 50) * 1000, 4),
+            "p95_ms": round(percentile(values, 95) * 1000, 4),
+        }
+    return summary
+
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(summary, previous=None):
+    header = f"{'stage':<24} {'docs/s':>10} {'p50 ms':>10} {'p95 ms':>10}"
+    if previous:
+        header += f" {'p50 vs prev':>12}"
+    print(header)
+    for stage, stats in summary.items():
+        line = f"{stage:<24} {stats['docs_per_sec'] or 0:>10.1f} {stats['p50_ms']:>10.3f} {stats['p95_ms']:>10.3f}"
+        old = (previous or {}).get(stage)
+        if old and old["p50_ms"]:
+            line += f" {stats['p50_ms'] / old['p50_ms']:>11.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=os.path.join(HERE, "corpus"),
+                        help="Corpus directory (generated if it has no manifest).")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--kinds", nargs="+", default=KINDS, choices=KINDS)
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the corpus.")
+    parser.add_argument("-o", "--output", default=os.path.join(HERE, "results", "pipeline.json"))
+    parser.add_argument("--compare", help="Earlier results JSON to compare p50 latency against.")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(args.corpus, "manifest.json")):
+        print(f"generating corpus in {args.corpus} ...", file=sys.stderr)
+        generate_corpus(args.corpus, seed=args.seed)
+    manifest = load_manifest(args.corpus)
+    documents = [d for d in manifest["documents"] if d["kind"] in args.kinds]
+
+    samples = defaultdict(list)
+    by_kind = defaultdict(lambda: defaultdict(list))
+    wall_start = time.perf_counter()
+    for _ in range(args.repeat):
+        for doc in documents:
+            timings = run_document(os.path.join(args.corpus, doc["file"]))
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+                by_kind[doc["kind"]][stage].append(seconds)
+    wall = time.perf_counter() - wall_start
+
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "corpus_seed": manifest["seed"],
+            "documents": len(documents),
+            "repeat": args.repeat,
+        },
+        "wall_s": round(wall, 3),
+        "peak_rss_mb": round(peak_rss_mb() or 0, 1),
+        "stages": summarise(samples),
+        "by_kind": {kind: summarise(kind_samples) for kind, kind_samples in by_kind.items()},
+    }
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)["stages"]
+
+    print_table(results["stages"], previous)
+    print(f"\n{len(documents) * args.repeat} documents in {wall:.2f}s, peak RSS {results['peak_rss_mb']} MB")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+score_batch: equality check against the per-document scoring + timing.
+
+    python benchmarks/bench_scoring.py
+    python benchmarks/bench_scoring.py --rows 200000 --seed 3
+
+Builds random analysed resumes (word counts around every threshold, 0-30
+skills, job descriptions matching any share of them, 0-5 filled sections),
+scores each with nlp.match_job_description + ats.compute_ats_breakdown and
+all of them with scoring.features_from_records + score_batch. Exits 1 if
+any score or ATS component differs.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from ats import compute_ats_breakdown
+from nlp import ResumeFeatures, match_job_description
+from scoring import features_from_records, score_batch
+
+COMPONENTS = ["Skills", "Keywords", "Structure", "Length"]
+SECTION_NAMES = ["Summary", "Skills", "Projects", "Education", "Achievements"]
+# word counts at and around every length rule, plus random ones
+EDGE_WORDS = [0, 1, 79, 80, 81, 119, 120, 121, 449, 450, 451, 599, 600, 601]
+
+
+def random_row(rng):
+    """(ResumeFeatures, job description or None, sections)"""
+    word_count = rng.choice(EDGE_WORDS) if rng.random() < 0.3 else rng.randint(0, 1200)
+    # "<i>" names: no skill name is a substring of another
+    skills = [f"<{i}>" for i in range(rng.randint(0, 30))]
+    job_description = None
+    if rng.random() < 0.7:
+        matched = rng.randint(0, len(skills))
+        job_description = " ".join(["role"] + skills[:matched])
+    filled = rng.randint(0, len(SECTION_NAMES))
+    sections = {name: ("text" if i < filled else rng.choice(("", "  "))) for i, name in enumerate(SECTION_NAMES)}
+    return ResumeFeatures(skills, {}, word_count), job_description, sections
+
+
+def per_document(rows):
+    results = []
+    for features, job_description, sections in rows:
+        skills, score, details = match_job_description(features, job_description)
+        ats_score, components = compute_ats_breakdown(details, sections)
+        record = {"ok": True, "details": details, "sections": sections,
+                  "has_job_description": bool(job_description)}
+        results.append((score, ats_score, components, record))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    rows = [random_row(rng) for _ in range(args.rows)]
+
+    start = time.perf_counter()
+    expected = per_document(rows)
+    one_by_one = time.perf_counter() - start
+
+    records = [record for _, _, _, record in expected]
+    start = time.perf_counter()
+    batch = score_batch(**features_from_records(records))
+    vectorised = time.perf_counter() - start
+
+    mismatches = []
+    for i, (score, ats_score, components, _) in enumerate(expected):
+        got = (int(batch["score"][i]), int(batch["ats_score"][i]), {c: int(batch[c][i]) for c in COMPONENTS})
+        if got != (score, ats_score, components):
+            mismatches.append((i, (score, ats_score, components), got))
+    if mismatches:
+        i, want, got = mismatches[0]
+        print(f"MISMATCH on {len(mismatches)} of {len(rows)} rows, first row {i}: expected {want}, got {got}",
+              file=sys.stderr)
+        return 1
+
+    print(f"{len(rows)} rows: identical scores and ATS components")
+    print(f"per document  {one_by_one:.3f}s  (includes the job match)")
+    print(f"score_batch   {vectorised:.3f}s  (includes features_from_records)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
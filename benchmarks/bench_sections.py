@@ -0,0 +1,95 @@
+"""
+detect_sections: regression examples + timing on resume-sized text.
+
+    python benchmarks/bench_sections.py
+    python benchmarks/bench_sections.py --repeat 500
+
+Every example must give exactly the expected {section: content}; exits 1
+on any mismatch before timing.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from sections import detect_sections
+
+# (text, expected sections) - header styles seen in real resumes
+EXAMPLES = [
+    ("Summary\nBackend engineer.\nSkills\nPython, SQL",
+     {"Summary": "Backend engineer.", "Skills": "Python, SQL"}),
+    ("Skills: Python, SQL\nProjects: Chatbot",
+     {"Skills": "Python, SQL", "Projects": "Chatbot"}),
+    ("PROFESSIONAL SUMMARY\nEngineer.\nKey Skills\nJava",
+     {"Summary": "Engineer.", "Skills": "Java"}),
+    ("Projects\nApp one\nPage 2\nProjects (contd.)\nApp two",
+     {"Projects": "App one Page 2 App two"}),
+    # plural forms
+    ("Summary\nEngineer.\nAcademic Qualifications\nB.Tech 2020\nInternships\nAcme intern",
+     {"Summary": "Engineer.", "Education": "B.Tech 2020", "Projects": "Acme intern"}),
+    # a trailing "& ..." / "and ..." phrase; several sections named -> the first one
+    ("Summary\nEngineer.\nSkills & Tools\nPython, Docker\nProjects\nChatbot",
+     {"Summary": "Engineer.", "Skills": "Python, Docker", "Projects": "Chatbot"}),
+    ("Skills\nPython\nEducation & Certifications\nB.Tech, AWS Certified",
+     {"Skills": "Python", "Education": "B.Tech, AWS Certified"}),
+    ("EDUCATION AND TRAINING\nB.Tech\nSkills/Tools: Git",
+     {"Education": "B.Tech", "Skills": "Git"}),
+    # list numbering
+    ("1. Education\nB.Tech\n2. Projects\nChatbot",
+     {"Education": "B.Tech", "Projects": "Chatbot"}),
+    ("I. Summary\nEngineer.\nII) Skills\nJava",
+     {"Summary": "Engineer.", "Skills": "Java"}),
+    # prose is not a header
+    ("Projects\nBuilt things.\nSkills and experience gained across teams\nmore",
+     {"Projects": "Built things. Skills and experience gained across teams more"}),
+    ("Strong communication skills\nwith clients", {}),
+    # flattened text: first whole-word mention of each section
+    ("Summary engineer Internships acme Education btech",
+     {"Summary": "engineer", "Projects": "acme", "Education": "btech"}),
+]
+
+HEADERS = ["SUMMARY", "Technical Skills", "1. Projects", "Internships", "Education & Certifications",
+           "Achievements"]
+
+
+def synthetic_resume(rng, lines_per_section=40):
+    words = "built designed python sql team data pipeline improved led users api release".split()
+    parts = []
+    for header in HEADERS:
+        parts.append(header)
+        parts.extend(" ".join(rng.choice(words) for _ in range(11)) for _ in range(lines_per_section))
+    return "\n".join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for text, expected in EXAMPLES:
+        got = dict(detect_sections(text))
+        if got != expected:
+            failures += 1
+            print(f"MISMATCH {text!r}\n  expected {expected}\n  got      {got}", file=sys.stderr)
+    if failures:
+        print(f"{failures} of {len(EXAMPLES)} examples differ", file=sys.stderr)
+        return 1
+    print(f"{len(EXAMPLES)} examples: all match")
+
+    text = synthetic_resume(random.Random(3))
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        sections = detect_sections(text)
+        for name in sections:
+            sections[name]
+    elapsed = (time.perf_counter() - start) / args.repeat
+    print(f"{len(text) / 1000:.0f} K chars, {len(HEADERS)} headers: {elapsed * 1000:.3f} ms per resume")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
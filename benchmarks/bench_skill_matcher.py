@@ -0,0 +1,104 @@
+"""
+Micro-benchmark: per-skill re.search loop vs the one-pass SkillMatcher.
+
+    python benchmarks/bench_skill_matcher.py            # 1k, 10k, 100k skills
+    python benchmarks/bench_skill_matcher.py 5000 50000
+
+Both approaches are checked to find exactly the same skills before timing.
+"""
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from matcher import SkillMatcher
+from nlp import CATEGORIES
+
+WORDS_IN_RESUME = 700
+
+
+def make_taxonomy(n_skills, rng):
+    """n_skills synthetic terms (1-3 words, some with symbols) spread over a few categories."""
+    base = [s for skills in CATEGORIES.values() for s in skills]
+    terms = set(base)
+    while len(terms) < n_skills:
+        words = []
+        for _ in range(rng.choice((1, 1, 2, 3))):
+            words.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))))
+        term = " ".join(words)
+        if rng.random() < 0.05:
+            term += rng.choice(("++", "#", ".js", "-ops"))
+        terms.add(term)
+    terms = sorted(terms)
+    rng.shuffle(terms)
+    categories = {}
+    for i, term in enumerate(terms[:n_skills]):
+        categories.setdefault(f"Category {i % 8}", []).append(term)
+    return categories
+
+
+def make_resume(categories, rng):
+    """Filler text with ~60 taxonomy terms sprinkled in."""
+    all_terms = [t for terms in categories.values() for t in terms]
+    words = []
+    for _ in range(WORDS_IN_RESUME):
+        if rng.random() < 0.08:
+            words.append(rng.choice(all_terms))
+        else:
+            words.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 10))))
+        if rng.random() < 0.1:
+            words[-1] += rng.choice((",", ".", ":", "\n"))
+    return " ".join(words)
+
+
+def legacy_find(categories, text):
+    """The original nlp.analyze_resume_text loop."""
+    found = []
+    for category, skills in categories.items():
+        for skill in skills:
+            if re.search(r"\b" + re.escape(skill) + r"\b", text):
+                found.append((skill, category))
+    return found
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or [1_000, 10_000, 100_000]
+    rng = random.Random(42)
+
+    print(f"{'skills':>8} {'build (s)':>10} {'loop (ms)':>10} {'matcher (ms)':>13} {'speed-up':>9}")
+    for n in sizes:
+        categories = make_taxonomy(n, rng)
+        text = make_resume(categories, rng)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher.from_categories(categories)
+        build = time.perf_counter() - start
+
+        expected = legacy_find(categories, text)
+        got = matcher.find(text)
+        if got != expected:
+            print(f"MISMATCH at {n} skills: {len(got)} vs {len(expected)}", file=sys.stderr)
+            return 1
+
+        repeat = 3 if n <= 10_000 else 1
+        loop = best_of(lambda: legacy_find(categories, text), repeat)
+        one_pass = best_of(lambda: matcher.find(text), 5)
+        print(f"{n:>8} {build:>10.2f} {loop * 1000:>10.1f} {one_pass * 1000:>13.2f} {loop / one_pass:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
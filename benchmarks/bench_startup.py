@@ -0,0 +1,81 @@
+"""
+Import-time benchmark for the src modules.
+
+    python benchmarks/bench_startup.py                  # table of import times
+    python benchmarks/bench_startup.py --check          # exit 1 if a light module
+                                                        # pulls in PDF/OCR/plotting
+    python benchmarks/bench_startup.py --check --budget-ms 150
+
+Every module is imported in a fresh interpreter, so the numbers are cold-start
+costs as paid by a Streamlit worker or a batch subprocess.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+MODULES = [
+    "nlp", "sections", "utils", "resume_builder", "ats", "matcher",
+    "extractor", "cache", "index", "pipeline", "charts",
+]
+
+# Must import without touching any heavy stack
+LIGHT_MODULES = ["nlp", "sections", "utils", "resume_builder", "extractor", "charts"]
+
+HEAVY_PACKAGES = ["fitz", "pymupdf", "pytesseract", "PIL", "pdfminer", "matplotlib", "streamlit"]
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(p for p in {heavy!r} if p in sys.modules)
+print(json.dumps({{"ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+
+def measure(module, repeat=3):
+    """Best-of-`repeat` cold import time (ms) and the heavy packages it loaded."""
+    best, heavy = float("inf"), []
+    for _ in range(repeat):
+        code = PROBE.format(src=os.path.abspath(SRC), module=module, heavy=HEAVY_PACKAGES)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        best = min(best, result["ms"])
+        heavy = result["heavy"]
+    return best, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true",
+                        help="Fail if a light module imports a PDF/OCR/plotting package.")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="With --check, also fail if a light module takes longer than this.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'module':<16} {'import (ms)':>12}  heavy packages loaded")
+    for module in MODULES:
+        ms, heavy = measure(module, args.repeat)
+        print(f"{module:<16} {ms:>12.1f}  {', '.join(heavy) or '-'}")
+        if module in LIGHT_MODULES:
+            if heavy:
+                failures.append(f"{module} imports {', '.join(heavy)}")
+            if args.budget_ms is not None and ms > args.budget_ms:
+                failures.append(f"{module} took {ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    if args.check and failures:
+        for failure in failures:
+            print("FAIL:", failure, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
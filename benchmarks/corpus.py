@@ -0,0 +1,134 @@
+"""
+Reproducible synthetic resume corpus for the benchmarks.
+
+    python benchmarks/corpus.py benchmarks/corpus            # default grid
+    python benchmarks/corpus.py out/ --pages 1 5 50 --seed 7
+
+Writes text PDFs (real text layer), scanned PDFs (every page is an image, no
+text layer) and hybrid PDFs (alternating), for each page count and skill
+density, plus a manifest.json describing every file. Same seed, same corpus.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from nlp import CATEGORIES
+
+KINDS = ["text", "scanned", "hybrid"]
+DEFAULT_PAGES = [1, 3, 10, 50]
+
+# fraction of filler words replaced by a skill
+DENSITIES = {"small": 0.01, "medium": 0.05, "huge": 0.25}
+
+FILLER = (
+    "designed built implemented led managed improved delivered developed analysed "
+    "reduced increased automated migrated tested deployed maintained the a of for "
+    "with team project system service customers users data reports pipeline platform "
+    "performance quality process dashboard feature release module api backend frontend"
+).split()
+
+HEADERS = ["SUMMARY", "SKILLS", "EXPERIENCE", "PROJECTS", "EDUCATION", "ACHIEVEMENTS"]
+
+SCAN_DPI = 150
+
+
+def page_lines(rng, density, n_lines=48, words_per_line=11):
+    """One page of resume-like text: section headers followed by prose lines."""
+    skills = [s for group in CATEGORIES.values() for s in group]
+    lines = []
+    for n in range(n_lines):
+        if n % 8 == 0:
+            lines.append(HEADERS[(n // 8) % len(HEADERS)])
+            continue
+        words = [
+            rng.choice(skills) if rng.random() < density else rng.choice(FILLER)
+            for _ in range(words_per_line)
+        ]
+        lines.append(" ".join(words).capitalize() + ".")
+    return lines
+
+
+def _write_text_page(doc, lines):
+    page = doc.new_page(width=595, height=842)  # A4 in points
+    page.insert_text((48, 56), "\n".join(lines), fontsize=9, lineheight=1.6)
+    return page
+
+
+def _write_scanned_page(doc, lines):
+    """Render a text page to an image and place only the image on a new page."""
+    import fitz
+
+    scratch = fitz.open()
+    _write_text_page(scratch, lines)
+    pix = scratch[0].get_pixmap(dpi=SCAN_DPI, colorspace=fitz.csGRAY)
+    scratch.close()
+
+    page = doc.new_page(width=595, height=842)
+    page.insert_image(page.rect, stream=pix.tobytes("png"))
+    return page
+
+
+def build_pdf(path, kind, pages, density, rng):
+    import fitz
+
+    doc = fitz.open()
+    for n in range(pages):
+        lines = page_lines(rng, density)
+        if n == 0:
+            lines = ["FULL NAME", "email@example.com | +91 00000 00000"] + lines
+        scanned = kind == "scanned" or (kind == "hybrid" and n % 2 == 1)
+        if scanned:
+            _write_scanned_page(doc, lines)
+        else:
+            _write_text_page(doc, lines)
+    doc.save(path, deflate=True)
+    doc.close()
+
+
+def generate_corpus(out_dir, seed=1234, kinds=KINDS, pages=DEFAULT_PAGES, densities=("small", "huge")):
+    """Create the corpus in out_dir and return the manifest (list of dicts)."""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    manifest = []
+    for kind in kinds:
+        for n_pages in pages:
+            for density in densities:
+                name = f"{kind}_{n_pages:02d}p_{density}.pdf"
+                path = os.path.join(out_dir, name)
+                build_pdf(path, kind, n_pages, DENSITIES[density], rng)
+                manifest.append({
+                    "file": name, "kind": kind, "pages": n_pages,
+                    "density": density, "bytes": os.path.getsize(path),
+                })
+
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({"seed": seed, "documents": manifest}, f, indent=2)
+    return manifest
+
+
+def load_manifest(out_dir):
+    with open(os.path.join(out_dir, "manifest.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("out_dir")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--kinds", nargs="+", default=KINDS, choices=KINDS)
+    parser.add_argument("--pages", nargs="+", type=int, default=DEFAULT_PAGES)
+    parser.add_argument("--densities", nargs="+", default=["small", "huge"], choices=list(DENSITIES))
+    args = parser.parse_args(argv)
+
+    manifest = generate_corpus(args.out_dir, args.seed, args.kinds, args.pages, args.densities)
+    total = sum(d["bytes"] for d in manifest)
+    print(f"wrote {len(manifest)} PDFs ({total / 1e6:.1f} MB) to {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Soak test for dashboard chart rendering: simulates thousands of Streamlit
+reruns and tracks resident memory.
+
+    python benchmarks/soak_charts.py                    # 3000 reruns, cached charts
+    python benchmarks/soak_charts.py --mode pyplot      # the old plt.subplots() path
+    python benchmarks/soak_charts.py --distinct 100     # more analyses than the cache holds (every rerun renders)
+
+Each rerun draws the ATS and category charts once. "cached" goes through
+src/charts.py; "pyplot" reproduces the previous app code, which never closed
+its figures. RSS is sampled every --every reruns; with the cache it should stay
+flat after warm-up. Exits 1 if RSS grows more than --max-growth-mb after warm-up.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from charts import ChartCache, ats_components_chart, category_counts_chart
+
+
+def rss_mb():
+    """Current resident set size (Linux); None elsewhere."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return None
+
+
+def analysis(i):
+    """The i-th of a few distinct (ats_components, category_counts) pairs."""
+    ats = {"Skills": 10 + i % 30, "Keywords": i % 31, "Structure": 4 * (i % 6), "Length": (2, 6, 10)[i % 3]}
+    categories = {"Programming": 1 + i % 5, "Data / ML": i % 4, "Web": i % 3, "Soft Skills": 1 + i % 2}
+    return ats, categories
+
+
+def rerun_pyplot(ats, categories):
+    import matplotlib.pyplot as plt
+
+    # what app.py used to do: plt.subplots() + st.pyplot (savefig), never closed
+    fig, ax = plt.subplots()
+    ax.bar(list(ats.keys()), list(ats.values()), color=["#3b82f6", "#22c55e", "#f97316", "#a855f7"])
+    ax.set_ylim(0, 100)
+    ax.set_ylabel("Score (0–100)")
+    ax.set_title("ATS Component Scores")
+    fig.savefig(io.BytesIO(), format="png", dpi=200, bbox_inches="tight")
+
+    fig2, ax2 = plt.subplots()
+    ax2.bar(categories.keys(), categories.values(), color="#0ea5e9")
+    ax2.set_ylabel("Count")
+    ax2.set_title("Detected Skill Categories")
+    fig2.savefig(io.BytesIO(), format="png", dpi=200, bbox_inches="tight")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["cached", "pyplot"], default="cached")
+    parser.add_argument("--reruns", type=int, default=3000)
+    parser.add_argument("--distinct", type=int, default=20, help="different analyses cycled through")
+    parser.add_argument("--cache-size", type=int, default=64,
+                        help="LRU size for --mode cached (two charts per analysis)")
+    parser.add_argument("--every", type=int, default=250, help="sample RSS every N reruns")
+    parser.add_argument("--warmup", type=int, default=500, help="reruns before the baseline sample")
+    parser.add_argument("--max-growth-mb", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    cache = ChartCache(max_entries=args.cache_size)
+    baseline = None
+    start = time.perf_counter()
+    print(f"{'rerun':>7} {'rss_mb':>8} {'elapsed_s':>10}")
+    for i in range(1, args.reruns + 1):
+        ats, categories = analysis(i % args.distinct)
+        if args.mode == "cached":
+            ats_components_chart(ats, cache=cache)
+            category_counts_chart(categories, cache=cache)
+        else:
+            rerun_pyplot(ats, categories)
+
+        if i == args.warmup:
+            baseline = rss_mb()
+        if i % args.every == 0 or i == args.reruns:
+            rss = rss_mb()
+            print(f"{i:>7} {rss or 0:>8.1f} {time.perf_counter() - start:>10.2f}", flush=True)
+
+    final = rss_mb()
+    if args.mode == "cached":
+        print(f"cache: {cache.stats()}")
+    if baseline is not None and final is not None:
+        growth = final - baseline
+        print(f"RSS growth after warm-up: {growth:+.1f} MB")
+        if args.max_growth_mb is not None and growth > args.max_growth_mb:
+            print(f"FAIL: RSS grew more than {args.max_growth_mb} MB", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
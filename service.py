@@ -0,0 +1,384 @@
+"""
+Standalone HTTP API for resume analysis (asyncio, standard library only).
+
+    python service.py --port 8080 --workers 4 --max-queue 32 --deadline 60
+
+    POST /analyze             raw PDF body (Content-Type: application/pdf), or
+                              multipart/form-data with a "file" part and an
+                              optional "job_description" part
+         ?job_description=... JD for a raw PDF body
+         ?wait=0              answer 202 {"job_id": ...} at once instead of the result
+         ?deadline=SECONDS    per-request deadline (capped at --deadline)
+    GET  /jobs/<job_id>       job state, plus the result once it is done
+    GET  /health              queue depth, running jobs and limits
+
+Uploads are queued and analysed on a process pool, at most --workers at a time.
+When --max-queue uploads are already waiting the service answers 429 with
+Retry-After instead of buffering more. A request whose deadline passes gets 504
+with its job ID; a job still queued at its deadline is dropped unanalysed.
+"""
+import argparse
+import asyncio
+import email.policy
+import json
+import os
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from email.parser import BytesParser
+from functools import partial
+from http import HTTPStatus
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Make sure we can import from src/ (also in spawned worker processes)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from pipeline import analyze_pdf_bytes
+from budget import default_budget
+
+MAX_HEADER_LINES = 100
+READ_TIMEOUT = 30.0   # seconds a client gets to send its request
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class Job:
+    """One queued upload. state: queued -> running -> done, or queued -> expired."""
+
+    def __init__(self, data: bytes, name: str, job_description: Optional[str], deadline: float):
+        self.id = uuid.uuid4().hex
+        self.data = data
+        self.name = name
+        self.job_description = job_description
+        self.deadline = deadline          # loop.time() value
+        self.created = time.time()
+        self.state = "queued"
+        self.result: Optional[Dict] = None
+        self.finished = asyncio.Event()
+
+    def finish(self, state: str, result: Optional[Dict] = None) -> None:
+        self.state = state
+        self.result = result
+        self.data = None                  # the upload is no longer needed
+        self.finished.set()
+
+    def to_dict(self) -> Dict:
+        out = {"job_id": self.id, "state": self.state}
+        if self.result is not None:
+            out["result"] = self.result
+        return out
+
+
+class AnalysisService:
+    """
+    Job queue in front of a process pool.
+      workers   - pool size, i.e. how many documents are analysed concurrently
+      max_queue - uploads allowed to wait; beyond that submit() refuses (429)
+      deadline  - default and maximum seconds a request may take
+      max_jobs  - finished jobs kept for GET /jobs/<id> (oldest evicted first)
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_queue: int = 32, deadline: float = 60.0,
+                 max_body: int = 20 * 1024 * 1024, max_jobs: int = 1000, ocr_workers: int = 0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.deadline = deadline
+        self.max_body = max_body
+        self.max_jobs = max_jobs
+        self.ocr_workers = ocr_workers
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self.running = 0
+        self.counters = {"accepted": 0, "rejected": 0, "completed": 0, "expired": 0, "timeouts": 0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._runners = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._runners = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        for task in self._runners:
+            task.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, data: bytes, name: str, job_description: Optional[str],
+               deadline: Optional[float] = None) -> Optional[Job]:
+        """Queue an upload; returns None when the queue is full."""
+        seconds = min(deadline or self.deadline, self.deadline)
+        job = Job(data, name, job_description, asyncio.get_running_loop().time() + seconds)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.counters["rejected"] += 1
+            return None
+        self.counters["accepted"] += 1
+        self._remember(job)
+        return job
+
+    def _remember(self, job: Job) -> None:
+        self.jobs[job.id] = job
+        if len(self.jobs) > self.max_jobs:
+            # unfinished jobs are bounded by max_queue + workers, so only finished ones go
+            for job_id in [k for k, j in self.jobs.items() if j.finished.is_set()]:
+                if len(self.jobs) <= self.max_jobs:
+                    break
+                del self.jobs[job_id]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            try:
+                if loop.time() >= job.deadline:
+                    self.counters["expired"] += 1
+                    job.finish("expired")
+                    continue
+                job.state = "running"
+                self.running += 1
+                pool = self._pool
+                try:
+                    # extraction stops at the job's deadline (partial text, "truncated")
+                    # so a pathological PDF cannot hold a worker past it
+                    limits = default_budget()
+                    remaining = job.deadline - loop.time()
+                    if limits.max_seconds is None or remaining < limits.max_seconds:
+                        limits = limits._replace(max_seconds=max(remaining, 0.0))
+                    result = await loop.run_in_executor(pool, partial(
+                        analyze_pdf_bytes, job.data, job.job_description, job.name,
+                        self.ocr_workers, budget=limits,
+                    ))
+                except BrokenProcessPool as e:
+                    # a worker died (e.g. killed for memory): report it and replace the pool once
+                    result = {"path": job.name, "ok": False, "error": f"{type(e).__name__}: {e}"}
+                    if self._pool is pool:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                finally:
+                    self.running -= 1
+                self.counters["completed"] += 1
+                job.finish("done", result)
+            finally:
+                self._queue.task_done()
+
+    def health(self) -> Dict:
+        return {
+            "status": "ok",
+            "queue_depth": self._queue.qsize(),
+            "running": self.running,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "deadline": self.deadline,
+            "jobs": len(self.jobs),
+            **self.counters,
+        }
+
+    # ---------------- HTTP ----------------
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, target, headers, body = await asyncio.wait_for(
+                    self._read_request(reader), READ_TIMEOUT
+                )
+                status, payload, extra = await self._route(method, target, headers, body)
+            except HTTPError as e:
+                status, payload, extra = e.status, {"error": e.message}, e.headers
+            except asyncio.TimeoutError:
+                status, payload, extra = 408, {"error": "request not received in time"}, {}
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as e:  # a bug must not leave the client without an answer
+                print(f"error handling request: {type(e).__name__}: {e}", file=sys.stderr)
+                status, payload, extra = 500, {"error": "internal server error"}, {}
+            await self._write_response(writer, status, payload, extra)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str], bytes]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            raise HTTPError(400, "malformed request line")
+        method, target, _version = parts
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HTTPError(431, "too many header lines")
+
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                raise HTTPError(411, "Content-Length required")
+            value = headers["content-length"]
+            # digits only: int() would also take "-5", "+5", "1_0" and " 5"
+            if not (value.isascii() and value.isdigit()) or len(value) > 18:
+                raise HTTPError(400, "bad Content-Length")
+            length = int(value)
+            if length > self.max_body:
+                raise HTTPError(413, f"upload larger than {self.max_body} bytes")
+            body = await reader.readexactly(length)
+        return method, target, headers, body
+
+    async def _route(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/health" and method == "GET":
+            return 200, self.health(), {}
+
+        if url.path.startswith("/jobs/") and method == "GET":
+            job = self.jobs.get(url.path[len("/jobs/"):])
+            if job is None:
+                raise HTTPError(404, "unknown job")
+            return 200, job.to_dict(), {}
+
+        if url.path == "/analyze" and method == "POST":
+            return await self._analyze(query, headers, body)
+
+        if url.path in ("/health", "/analyze") or url.path.startswith("/jobs/"):
+            raise HTTPError(405, "method not allowed")
+        raise HTTPError(404, "not found")
+
+    async def _analyze(self, query: Dict[str, str], headers: Dict[str, str], body: bytes):
+        data, name, job_description = parse_upload(headers.get("content-type", ""), body)
+        job_description = job_description or query.get("job_description") or None
+        try:
+            deadline = float(query["deadline"]) if "deadline" in query else None
+        except ValueError:
+            raise HTTPError(400, "deadline must be a number of seconds")
+        if deadline is not None and deadline <= 0:
+            raise HTTPError(400, "deadline must be positive")
+
+        job = self.submit(data, name, job_description, deadline)
+        if job is None:
+            raise HTTPError(429, "analysis queue is full, retry later",
+                            {"Retry-After": str(max(1, round(self.deadline / 10)))})
+
+        if query.get("wait", "1").lower() in ("0", "false", "no"):
+            return 202, {"job_id": job.id, "state": job.state, "status_url": f"/jobs/{job.id}"}, {}
+
+        remaining = job.deadline - asyncio.get_running_loop().time()
+        try:
+            await asyncio.wait_for(job.finished.wait(), max(0.0, remaining))
+        except asyncio.TimeoutError:
+            pass
+        if job.state != "done":
+            # a running job keeps going and can still be fetched from /jobs/<id>
+            self.counters["timeouts"] += 1
+            return 504, {"error": "deadline exceeded", **job.to_dict()}, {}
+        return 200, job.to_dict(), {}
+
+    @staticmethod
+    async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Dict,
+                              extra: Dict[str, str]) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            "Connection: close",
+        ]
+        head += [f"{k}: {v}" for k, v in extra.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+def parse_upload(content_type: str, body: bytes) -> Tuple[bytes, str, Optional[str]]:
+    """(pdf bytes, file name, job description or None) from a raw or multipart body."""
+    name, job_description = "upload.pdf", None
+    if content_type.lower().startswith("multipart/form-data"):
+        message = BytesParser(policy=email.policy.HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        )
+        if not message.is_multipart():
+            raise HTTPError(400, "malformed multipart body")
+        data = None
+        for part in message.iter_parts():
+            field = part.get_param("name", header="content-disposition")
+            payload = part.get_payload(decode=True) or b""
+            if field == "file":
+                data, name = payload, part.get_filename() or name
+            elif field == "job_description":
+                job_description = payload.decode(part.get_content_charset() or "utf-8", "replace")
+        if data is None:
+            raise HTTPError(400, 'multipart upload needs a "file" part')
+    else:
+        data = body
+
+    if not data.lstrip()[:5].startswith(b"%PDF"):
+        raise HTTPError(415, "upload is not a PDF")
+    return data, name, job_description
+
+
+async def serve(host: str, port: int, service: AnalysisService) -> None:
+    await service.start()
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"🚀 Listening on http://{host}:{port} "
+          f"(workers={service.workers}, max queue={service.max_queue}, deadline={service.deadline}s)",
+          file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Resume analysis HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="documents analysed concurrently (default: CPU count)")
+    parser.add_argument("--max-queue", type=int, default=32,
+                        help="uploads allowed to wait before answering 429")
+    parser.add_argument("--deadline", type=float, default=60.0,
+                        help="default and maximum seconds per request")
+    parser.add_argument("--max-body-mb", type=float, default=20.0,
+                        help="largest accepted upload in MB")
+    parser.add_argument("--max-jobs", type=int, default=1000,
+                        help="finished jobs kept for GET /jobs/<id>")
+    parser.add_argument("--ocr-workers", type=int, default=0,
+                        help="OCR threads per document (0 = sequential)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    service = AnalysisService(
+        workers=args.workers,
+        max_queue=args.max_queue,
+        deadline=args.deadline,
+        max_body=int(args.max_body_mb * 1024 * 1024),
+        max_jobs=args.max_jobs,
+        ocr_workers=args.ocr_workers,
+    )
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+# src/ats.py
+from typing import Dict, Mapping, Tuple, Union
+
+from document import Document
+
+
+def compute_ats_breakdown(details: Dict, sections: Union[Mapping, Document]) -> Tuple[int, Dict[str, int]]:
+    """
+    Compute simple ATS-style component scores.
+    Components: Skills, Keywords, Structure, Length.
+    `sections` may be the resume's Document (its sections and word count are used).
+    """
+    if isinstance(sections, Document):
+        word_count = details.get("word_count", sections.word_count)
+        sections = sections.sections
+    else:
+        word_count = details.get("word_count", 0)
+    num_skills = details.get("num_skills", 0)
+    jd_match = details.get("jd_match_score", 0)
+
+    # Skills: up to 40 points
+    skills_score = min(num_skills * 5, 40)
+
+    # Keywords (JD match): up to 30 points
+    keyword_score = min(jd_match, 30)
+
+    # Structure: based on number of sections detected: up to 20 points
+    num_sections = len([s for s in sections.values() if s.strip()])
+    structure_score = min(num_sections * 4, 20)
+
+    # Length: 0–10 based on ideal word range
+    if 120 <= word_count <= 450:
+        length_score = 10
+    elif 80 <= word_count < 120 or 450 < word_count <= 600:
+        length_score = 6
+    else:
+        length_score = 2
+
+    total = min(skills_score + keyword_score + structure_score + length_score, 100)
+
+    return int(total), {
+        "Skills": int(skills_score),
+        "Keywords": int(keyword_score),
+        "Structure": int(structure_score),
+        "Length": int(length_score),
+    }
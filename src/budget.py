@@ -0,0 +1,203 @@
+# src/budget.py
+"""
+Per-document resource limits for extraction, and a per-process circuit
+breaker that turns OCR off while it keeps failing.
+
+A document that hits a limit is not an error: extraction stops (or skips the
+expensive step) and returns the text it has, flagged with the reason.
+"""
+import math
+import os
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
+# Values of BudgetTracker.truncated (and of "truncated" in pipeline records)
+TRUNCATION_REASONS = {
+    "max_seconds": "time limit reached",
+    "max_pages": "page limit reached",
+    "max_ocr_pages": "OCR page limit reached",
+    "max_pixmap_bytes": "page image too large to OCR",
+    "ocr_failed": "OCR failed on some pages",
+    "ocr_unavailable": "OCR temporarily disabled after repeated failures",
+}
+
+# Limits that cut the same document short the same way every time (the rest
+# depend on the clock or on OCR health), so such a result can be cached
+DETERMINISTIC_REASONS = frozenset({"max_pages", "max_ocr_pages", "max_pixmap_bytes"})
+
+
+class Budget(NamedTuple):
+    """Limits for one document; None means unlimited."""
+    max_seconds: Optional[float] = None       # wall time for the whole extraction
+    max_pages: Optional[int] = None           # pages read (PyMuPDF or pdfminer)
+    max_ocr_pages: Optional[int] = None       # pages sent to Tesseract
+    max_pixmap_bytes: Optional[int] = None    # size of one rendered page image
+
+    def start(self) -> "BudgetTracker":
+        return BudgetTracker(self)
+
+
+def _env_number(name: str, default, cast=float):
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    return None if value.lower() in ("0", "none", "off") else cast(value)
+
+
+def default_budget() -> Budget:
+    """
+    The budget used when a caller gives none. Override with RESUME_MAX_SECONDS,
+    RESUME_MAX_PAGES, RESUME_MAX_OCR_PAGES and RESUME_MAX_PIXMAP_MB (0 = unlimited).
+    """
+    pixmap_mb = _env_number("RESUME_MAX_PIXMAP_MB", 128.0)
+    return Budget(
+        max_seconds=_env_number("RESUME_MAX_SECONDS", 120.0),
+        max_pages=_env_number("RESUME_MAX_PAGES", 200, int),
+        max_ocr_pages=_env_number("RESUME_MAX_OCR_PAGES", 50, int),
+        max_pixmap_bytes=int(pixmap_mb * 1024 * 1024) if pixmap_mb is not None else None,
+    )
+
+
+class BudgetExceeded(Exception):
+    """Raised inside a parser to stop it; `reason` names the limit."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class BudgetTracker:
+    """
+    What one document has used so far. `truncated` is the first limit that
+    cut something short (e.g. "max_seconds", "max_ocr_pages"), else None;
+    a reason outside DETERMINISTIC_REASONS replaces a deterministic one, so
+    `truncated` alone says whether the same call would give the same text.
+    """
+
+    def __init__(self, budget: Budget):
+        self.budget = budget
+        self.started = time.monotonic()
+        self.deadline = self.started + budget.max_seconds if budget.max_seconds is not None else None
+        self.ocr_pages = 0
+        self.truncated: Optional[str] = None
+
+    def mark(self, reason: str) -> None:
+        if self.truncated is None or (self.truncated in DETERMINISTIC_REASONS
+                                      and reason not in DETERMINISTIC_REASONS):
+            self.truncated = reason
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without one)."""
+        return None if self.deadline is None else max(self.deadline - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def check(self) -> None:
+        """Raise BudgetExceeded once the deadline has passed."""
+        if self.expired():
+            self.mark("max_seconds")
+            raise BudgetExceeded("max_seconds")
+
+    def pages_left(self, pages_done: int) -> bool:
+        return self.budget.max_pages is None or pages_done < self.budget.max_pages
+
+    def take_ocr_page(self) -> bool:
+        """Count one page for OCR; False (and truncated) once max_ocr_pages were used."""
+        if self.budget.max_ocr_pages is not None and self.ocr_pages >= self.budget.max_ocr_pages:
+            self.mark("max_ocr_pages")
+            return False
+        self.ocr_pages += 1
+        return True
+
+    def fit_dpi(self, width_pt: float, height_pt: float, dpi: int, min_dpi: int) -> Optional[int]:
+        """
+        Highest DPI up to `dpi` at which a grayscale render of a width x height
+        (points) region stays within max_pixmap_bytes; None if that would be
+        under `min_dpi` (too blurry to OCR).
+        """
+        limit = self.budget.max_pixmap_bytes
+        if limit is None:
+            return dpi
+        pixels = (width_pt / 72 * dpi) * (height_pt / 72 * dpi)
+        if pixels <= limit:
+            return dpi
+        fitted = int(dpi * math.sqrt(limit / pixels))
+        if fitted < min_dpi:
+            self.mark("max_pixmap_bytes")
+            return None
+        return fitted
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency for a while. After `failure_threshold`
+    consecutive failures the breaker opens and allow() returns False; after
+    `reset_seconds` one trial call is let through (half-open): success
+    closes the breaker, failure opens it again. Thread-safe.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self._trial = True  # let exactly one call find out whether it recovered
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def release_trial(self) -> None:
+        """The call allow() let through ended without a verdict (e.g. it ran out of time)."""
+        with self._lock:
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+
+_ocr_breaker: Optional[CircuitBreaker] = None
+_ocr_breaker_lock = threading.Lock()
+
+
+def get_ocr_breaker() -> CircuitBreaker:
+    """
+    The breaker OCR calls in this process go through. RESUME_OCR_BREAKER_FAILURES
+    (default 3) and RESUME_OCR_BREAKER_RESET (seconds, default 60) tune it.
+    """
+    global _ocr_breaker
+    with _ocr_breaker_lock:
+        if _ocr_breaker is None:
+            _ocr_breaker = CircuitBreaker(
+                failure_threshold=int(os.environ.get("RESUME_OCR_BREAKER_FAILURES", "3")),
+                reset_seconds=float(os.environ.get("RESUME_OCR_BREAKER_RESET", "60")),
+            )
+        return _ocr_breaker
@@ -0,0 +1,188 @@
+# src/cache.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
+
+from budget import DETERMINISTIC_REASONS, Budget, default_budget
+from diagnostics import Diagnostics
+from extractor import Extraction, extract_text_from_pdf, ocr_settings
+from ingest import open_pdf_source
+
+# Bump when extractor output changes so stale on-disk entries are ignored
+CACHE_VERSION = 3
+
+ExtractionResult = Extraction
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hex digest of raw document bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(data, **settings) -> str:
+    """Key for an extraction: PDF bytes (any bytes-like object) + extractor settings + cache version."""
+    h = hashlib.sha256(data)
+    h.update(json.dumps({"v": CACHE_VERSION, **settings}, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier cache for extract_text_from_pdf results.
+      - in-process LRU holding at most `max_entries` results
+      - optional SQLite file (`db_path`) that survives restarts
+    Safe to share between threads (Streamlit sessions).
+    """
+
+    def __init__(self, max_entries: int = 64, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._memory: "OrderedDict[str, ExtractionResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                " key TEXT PRIMARY KEY, text TEXT NOT NULL,"
+                " ocr_used INTEGER NOT NULL, page_count INTEGER NOT NULL, truncated TEXT)"
+            )
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(extractions)")]
+            if "truncated" not in columns:  # file written before truncated results were cached
+                self._db.execute("ALTER TABLE extractions ADD COLUMN truncated TEXT")
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[ExtractionResult]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT text, ocr_used, page_count, truncated FROM extractions WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value = Extraction(row[0], bool(row[1]), row[2], row[3])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: ExtractionResult) -> None:
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                text, ocr_used, page_count, truncated = value
+                self._db.execute(
+                    "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?)",
+                    (key, text, int(ocr_used), page_count, truncated),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, value: ExtractionResult) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._memory),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM extractions")
+                self._db.commit()
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> ExtractionCache:
+    """
+    Process-wide cache shared by every caller (and every Streamlit session).
+    Set RESUME_CACHE_DB to a file path to enable the on-disk tier and
+    RESUME_CACHE_SIZE to change the in-memory limit.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ExtractionCache(
+                max_entries=int(os.environ.get("RESUME_CACHE_SIZE", "64")),
+                db_path=os.environ.get("RESUME_CACHE_DB") or None,
+            )
+        return _default_cache
+
+
+def cached_extract_text_from_pdf(uploaded_file, cache: Optional[ExtractionCache] = None,
+                                 diagnostics: Optional[Diagnostics] = None,
+                                 budget: Optional[Budget] = None,
+                                 runner: Optional[Callable[[Callable[[], Extraction]], Extraction]] = None,
+                                 **settings) -> Extraction:
+    """Same as cached_extract_with_key, without the key."""
+    return cached_extract_with_key(uploaded_file, cache, diagnostics, budget, runner, **settings)[1]
+
+
+def cached_extract_with_key(uploaded_file, cache: Optional[ExtractionCache] = None,
+                            diagnostics: Optional[Diagnostics] = None,
+                            budget: Optional[Budget] = None,
+                            runner: Optional[Callable[[Callable[[], Extraction]], Extraction]] = None,
+                            **settings) -> Tuple[str, Extraction]:
+    """
+    Same as extract_text_from_pdf, but returns the stored result when these
+    exact PDF bytes were already extracted with the same settings, OCR
+    language and OCR backend. The budget's page and pixmap limits are part
+    of the key, so a result they cut short is stored too (the same call
+    truncates it the same way); one stopped by the time limit or by failing
+    OCR is not, so a later call gets the full text.
+
+    runner: on a miss the extraction is run as runner(extract), extract taking
+            no arguments (e.g. through the shared executor, see executor.py);
+            cache hits never wait for it.
+
+    Returns (key, result). The key names this text (same bytes and settings,
+    same key), so callers can key what they derive from it without hashing
+    the file again.
+    """
+    cache = cache or get_default_cache()
+    if budget is None:
+        budget = default_budget()
+    # max_seconds is left out: it only decides whether a result is stored
+    limits = [budget.max_pages, budget.max_ocr_pages, budget.max_pixmap_bytes]
+
+    # hash and (on a miss) extract from the same buffer, without reading a copy
+    with open_pdf_source(uploaded_file) as source:
+        key = cache_key(source.buffer, limits=limits, **ocr_settings(), **settings)
+
+        result = cache.get(key)
+        if diagnostics is not None:
+            diagnostics.count("cache_hits" if result is not None else "cache_misses")
+        if result is None:
+            extract = partial(extract_text_from_pdf, source, diagnostics=diagnostics, budget=budget, **settings)
+            result = runner(extract) if runner is not None else extract()
+            if result.truncated is None or result.truncated in DETERMINISTIC_REASONS:
+                cache.put(key, result)
+    return key, result
@@ -0,0 +1,107 @@
+# src/charts.py
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+ATS_COLORS = ["#3b82f6", "#22c55e", "#f97316", "#a855f7"]
+CATEGORY_COLOR = "#0ea5e9"
+DPI = 200  # what st.pyplot used, so the charts look the same
+
+
+class ChartCache:
+    """
+    LRU of rendered PNG bytes, keyed by chart kind + the plotted values.
+    Reruns with the same analysis reuse the image instead of drawing it again.
+    Safe to share between threads (Streamlit sessions).
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._images: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: Tuple, render) -> bytes:
+        with self._lock:
+            png = self._images.get(key)
+            if png is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return png
+            self.misses += 1
+
+        png = render()
+
+        with self._lock:
+            self._images[key] = png
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+        return png
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._images)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+
+_default_cache = ChartCache(int(os.environ.get("RESUME_CHART_CACHE_SIZE", "128")))
+# matplotlib is not thread-safe; one render at a time
+_render_lock = threading.Lock()
+
+
+def _bar_chart_png(labels, values, color, title: str, ylabel: str,
+                   ylim: Optional[Tuple[int, int]] = None) -> bytes:
+    # A plain Figure is not registered with pyplot, so nothing keeps it alive
+    # after this function returns (plt.subplots figures stay until plt.close).
+    from matplotlib.figure import Figure
+
+    with _render_lock:
+        fig = Figure()
+        try:
+            ax = fig.subplots()
+            ax.bar(labels, values, color=color)
+            if ylim is not None:
+                ax.set_ylim(*ylim)
+            ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=DPI, bbox_inches="tight")
+        finally:
+            fig.clear()
+    return buf.getvalue()
+
+
+def ats_components_chart(components: Dict[str, int], cache: Optional[ChartCache] = None) -> bytes:
+    """PNG bar chart of compute_ats_breakdown components (0-100 scale)."""
+    items = tuple((str(k), int(v)) for k, v in components.items())
+    return (cache or _default_cache).get_or_render(
+        ("ats", items),
+        lambda: _bar_chart_png(
+            [k for k, _ in items], [v for _, v in items], ATS_COLORS,
+            "ATS Component Scores", "Score (0–100)", ylim=(0, 100),
+        ),
+    )
+
+
+def category_counts_chart(counts: Dict[str, int], cache: Optional[ChartCache] = None) -> bytes:
+    """PNG bar chart of details["category_counts"]."""
+    items = tuple((str(k), int(v)) for k, v in counts.items())
+    return (cache or _default_cache).get_or_render(
+        ("categories", items),
+        lambda: _bar_chart_png(
+            [k for k, _ in items], [v for _, v in items], CATEGORY_COLOR,
+            "Detected Skill Categories", "Count",
+        ),
+    )
+
+
+def get_default_chart_cache() -> ChartCache:
+    """Process-wide chart cache; RESUME_CHART_CACHE_SIZE sets its size (default 128 images)."""
+    return _default_cache
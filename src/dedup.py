@@ -0,0 +1,250 @@
+# src/dedup.py
+import hashlib
+import json
+import re
+import sqlite3
+import zlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Defaults: 128 hash functions in 16 bands of 8 rows. A pair lands in a common
+# bucket with probability 1 - (1 - s^8)^16: ~0.98 at 80% shingle overlap,
+# ~0.04 at 50%, so few candidates need checking.
+NUM_PERM = 128
+BANDS = 16
+SHINGLE_SIZE = 3          # words per shingle
+THRESHOLD = 0.8           # estimated Jaccard similarity to count as a duplicate
+SEED = 20240611
+
+_TOKEN_RE = re.compile(r"\w+")
+_MIX = np.uint64(0x100000001B3)   # FNV prime, combines token hashes into shingle hashes
+_CHUNK = 4096                     # shingles hashed at once (bounds memory per document)
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """Unique 64-bit hashes of the word `size`-grams of `text` (case-insensitive)."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return np.zeros(0, dtype=np.uint64)
+    ids = np.fromiter((zlib.crc32(t.encode("utf-8")) for t in tokens), dtype=np.uint64, count=len(tokens))
+    size = min(size, len(ids))
+    n = len(ids) - size + 1
+    hashes = np.zeros(n, dtype=np.uint64)
+    for j in range(size):
+        hashes = hashes * _MIX + ids[j:j + n]  # wraps mod 2**64
+    return np.unique(hashes)
+
+
+class MinHasher:
+    """MinHash signatures (uint32[num_perm]) from multiply-shift hashes of shingles."""
+
+    def __init__(self, num_perm: int = NUM_PERM, shingle_size: int = SHINGLE_SIZE, seed: int = SEED):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._a = (rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = shingle_hashes(text, self.shingle_size)
+        signature = np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        a, b = self._a[:, None], self._b[:, None]
+        for start in range(0, len(hashes), _CHUNK):
+            chunk = hashes[None, start:start + _CHUNK]
+            values = ((a * chunk + b) >> np.uint64(32)).astype(np.uint32)
+            np.minimum(signature, values.min(axis=1), out=signature)
+        return signature
+
+
+def similarity(sig1: np.ndarray, sig2: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the two documents' shingle sets."""
+    return float(np.count_nonzero(sig1 == sig2)) / len(sig1)
+
+
+class DedupIndex:
+    """
+    On-disk (SQLite) store of MinHash signatures with LSH band buckets, so a
+    new document is compared only against documents sharing a bucket.
+
+      query(signature)   near-duplicates already stored, most similar first
+      find_exact(hash)   a stored document with identical PDF bytes
+      add(key, ...)      store a document (replaces an earlier one with the same key)
+      groups()           all near-duplicate groups, in roughly linear time
+
+    Several processes can read while one writes (WAL journal); readonly=True
+    opens an existing index without write access.
+    """
+
+    def __init__(self, path: str, threshold: float = THRESHOLD, num_perm: int = NUM_PERM,
+                 bands: int = BANDS, shingle_size: int = SHINGLE_SIZE, readonly: bool = False):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.path = path
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        if readonly:
+            self._db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS docs ("
+                " id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL,"
+                " content_hash TEXT, signature BLOB NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS docs_content_hash ON docs (content_hash);"
+                "CREATE TABLE IF NOT EXISTS bands ("
+                " band INTEGER NOT NULL, bucket INTEGER NOT NULL, doc_id INTEGER NOT NULL,"
+                " PRIMARY KEY (band, bucket, doc_id)) WITHOUT ROWID;"
+            )
+
+        # signatures are only comparable with the same parameters
+        params = {"num_perm": num_perm, "bands": bands, "shingle_size": shingle_size, "seed": SEED}
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'params'").fetchone()
+        if row is None:
+            if readonly:
+                raise ValueError(f"{path} is not an initialised dedup index")
+            self._db.execute("INSERT INTO meta VALUES ('params', ?)", (json.dumps(params),))
+            self._db.commit()
+        elif json.loads(row[0]) != params:
+            raise ValueError(f"{path} was built with different parameters: {row[0]}")
+
+        self.hasher = MinHasher(num_perm, shingle_size)
+
+    # ---------- signatures ---------- #
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of `text`; None if it has no words (nothing to compare)."""
+        if not _TOKEN_RE.search(text):
+            return None
+        return self.hasher.signature(text)
+
+    def _buckets(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        buckets = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            digest = hashlib.blake2b(rows, digest_size=8).digest()
+            buckets.append((band, int.from_bytes(digest, "little", signed=True)))
+        return buckets
+
+    # ---------- reading ---------- #
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def find_exact(self, content_hash: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT key FROM docs WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def query(self, signature: np.ndarray, exclude: Optional[str] = None) -> List[Tuple[float, str]]:
+        """(similarity, key) of stored near-duplicates at or above the threshold, best first."""
+        candidates: Set[int] = set()
+        for band, bucket in self._buckets(signature):
+            candidates.update(
+                doc_id for (doc_id,) in self._db.execute(
+                    "SELECT doc_id FROM bands WHERE band = ? AND bucket = ?", (band, bucket)
+                )
+            )
+
+        matches = []
+        for doc_id in candidates:
+            row = self._db.execute("SELECT key, signature FROM docs WHERE id = ?", (doc_id,)).fetchone()
+            if row is None or row[0] == exclude:
+                continue  # replaced by a concurrent writer, or the document itself
+            key, blob = row
+            score = similarity(signature, np.frombuffer(blob, dtype=np.uint32))
+            if score >= self.threshold:
+                matches.append((round(score, 4), key))
+        matches.sort(key=lambda m: (-m[0], m[1]))
+        return matches
+
+    def groups(self) -> List[List[str]]:
+        """Near-duplicate groups (2+ keys each), found bucket by bucket with union-find."""
+        keys: Dict[int, str] = {}
+        signatures: Dict[int, np.ndarray] = {}
+        for doc_id, key, blob in self._db.execute("SELECT id, key, signature FROM docs"):
+            keys[doc_id] = key
+            signatures[doc_id] = np.frombuffer(blob, dtype=np.uint32)
+
+        parent = {doc_id: doc_id for doc_id in keys}
+
+        def find(x):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        bucket_key, members = None, []
+
+        def merge(members):
+            first = members[0]
+            for other in members[1:]:
+                a, b = find(first), find(other)
+                if a != b and similarity(signatures[first], signatures[other]) >= self.threshold:
+                    parent[b] = a
+
+        for band, bucket, doc_id in self._db.execute(
+            "SELECT band, bucket, doc_id FROM bands ORDER BY band, bucket"
+        ):
+            if (band, bucket) != bucket_key:
+                if len(members) > 1:
+                    merge(members)
+                bucket_key, members = (band, bucket), []
+            members.append(doc_id)
+        if len(members) > 1:
+            merge(members)
+
+        grouped: Dict[int, List[str]] = {}
+        for doc_id, key in keys.items():
+            grouped.setdefault(find(doc_id), []).append(key)
+        return sorted((sorted(g) for g in grouped.values() if len(g) > 1), key=lambda g: g[0])
+
+    # ---------- writing ---------- #
+
+    def add(self, key: str, signature, content_hash: Optional[str] = None,
+            commit: bool = True) -> None:
+        """signature: from signature(), or its tobytes() (as pipeline records carry it)."""
+        if isinstance(signature, bytes):
+            signature = np.frombuffer(signature, dtype=np.uint32)
+        self._remove(key)
+        cur = self._db.execute(
+            "INSERT INTO docs (key, content_hash, signature) VALUES (?, ?, ?)",
+            (key, content_hash, np.asarray(signature, dtype=np.uint32).tobytes()),
+        )
+        doc_id = cur.lastrowid
+        self._db.executemany(
+            "INSERT OR IGNORE INTO bands VALUES (?, ?, ?)",
+            ((band, bucket, doc_id) for band, bucket in self._buckets(signature)),
+        )
+        if commit:
+            self._db.commit()
+
+    def _remove(self, key: str) -> None:
+        row = self._db.execute("SELECT id, signature FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return
+        doc_id, blob = row
+        self._db.executemany(
+            "DELETE FROM bands WHERE band = ? AND bucket = ? AND doc_id = ?",
+            ((band, bucket, doc_id) for band, bucket in self._buckets(np.frombuffer(blob, dtype=np.uint32))),
+        )
+        self._db.execute("DELETE FROM docs WHERE id = ?", (doc_id,))
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
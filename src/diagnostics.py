@@ -0,0 +1,92 @@
+# src/diagnostics.py
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Optional, Union
+
+Number = Union[int, float]
+
+
+class Diagnostics:
+    """
+    Timings and counters for one document.
+    Code that is instrumented takes `diagnostics=None`; passing None keeps the
+    cost to a single `is not None` check, so it is free when disabled.
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}   # stage -> seconds
+        self.counters: Dict[str, Number] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, n: Number = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> Dict:
+        return {
+            "timings_ms": {k: round(v * 1000, 3) for k, v in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+
+def stage(diagnostics: Optional[Diagnostics], name: str):
+    """`with stage(diag, "name"):` times a block, or does nothing when diag is None."""
+    return diagnostics.stage(name) if diagnostics is not None else nullcontext()
+
+
+class MetricsSummary:
+    """Totals over many per-document diagnostics records (batch / service path)."""
+
+    def __init__(self):
+        self.documents = 0
+        self.failures = 0
+        self.stage_seconds: Dict[str, float] = {}
+        self.counters: Dict[str, Number] = {}
+
+    def add(self, record: Dict, ok: bool = True) -> None:
+        """Add one Diagnostics.to_dict() record."""
+        self.documents += 1
+        if not ok:
+            self.failures += 1
+        for name, ms in record.get("timings_ms", {}).items():
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + ms / 1000
+        for name, value in record.get("counters", {}).items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_dict(self) -> Dict:
+        return {
+            "documents": self.documents,
+            "failures": self.failures,
+            "stage_seconds": {k: round(v, 6) for k, v in self.stage_seconds.items()},
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self, prefix: str = "resume") -> str:
+        """Prometheus text exposition format."""
+        lines = []
+
+        def metric(name: str, help_text: str, samples: Iterable):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        metric("documents_total", "Documents processed.", [("", self.documents)])
+        metric("failures_total", "Documents that failed.", [("", self.failures)])
+        metric(
+            "stage_seconds_total", "Wall time spent per pipeline stage.",
+            [(f'{{stage="{name}"}}', round(v, 6)) for name, v in sorted(self.stage_seconds.items())],
+        )
+        for name, value in sorted(self.counters.items()):
+            metric(f"{name}_total", f"Sum of the {name} counter.", [("", value)])
+        return "\n".join(lines) + "\n"
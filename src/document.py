@@ -0,0 +1,54 @@
+# src/document.py
+from typing import Optional, Union
+
+from sections import Sections, find_section_spans
+
+
+class Document:
+    """
+    One extracted resume, made once after extraction and passed to every
+    analysis step, so each derived view of the text is computed at most once:
+
+      text        the cleaned text (shared, never copied)
+      lower       lowercase copy, for skill matching
+      word_count  whitespace-separated words
+      sections    Sections over `text` (header offsets found on first use)
+
+    All views are lazy; a step that does not need one never pays for it.
+    """
+    __slots__ = ("text", "_lower", "_word_count", "_sections")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._lower: Optional[str] = None
+        self._word_count: Optional[int] = None
+        self._sections: Optional[Sections] = None
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def word_count(self) -> int:
+        if self._word_count is None:
+            self._word_count = len(self.text.split())
+        return self._word_count
+
+    @property
+    def sections(self) -> Sections:
+        if self._sections is None:
+            self._sections = Sections(self.text, find_section_spans(self.text))
+        return self._sections
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"Document({len(self.text)} chars)"
+
+
+def as_document(text: Union[str, Document]) -> Document:
+    """`text` itself if it is a Document, else a new Document over it."""
+    return text if isinstance(text, Document) else Document(text)
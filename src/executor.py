@@ -0,0 +1,206 @@
+# src/executor.py
+"""
+Process-wide executor for document extraction, shared by every Streamlit
+session (each session runs its script on its own thread).
+
+  - at most `max_workers` extractions run at once;
+  - waiting jobs are started round-robin across sessions, so one session
+    uploading many files does not hold up the others;
+  - at most `max_queue` jobs wait; beyond that submit() raises QueueFull;
+  - a waiting caller can show its position in the queue.
+
+get_ocr_slots() is a separate cap on Tesseract runs at the same time in
+this process, whoever starts them (the executor, batch workers' OCR threads).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional
+
+
+class QueueFull(Exception):
+    """Too many jobs are already waiting; try again later."""
+
+
+class Ticket:
+    """One submitted job. state: queued -> running -> done, or queued -> cancelled."""
+
+    def __init__(self, session: str, fn: Callable):
+        self.session = session
+        self.fn = fn
+        self.state = "queued"
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+        self._done = threading.Event()
+        self._result = None
+        self._error: Optional[BaseException] = None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """True once the job has finished (or was cancelled)."""
+        return self._done.wait(timeout)
+
+    def result(self):
+        """The job's return value; re-raises its exception. Only after wait() returned True."""
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class FairExecutor:
+    """
+    Fixed pool of worker threads fed from one queue per session. Workers take
+    the next job from the session at the head of the rotation, which then
+    moves to the back, so each session with waiting jobs gets a turn.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 32):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._cond = threading.Condition()
+        self._queues: "OrderedDict[str, Deque[Ticket]]" = OrderedDict()  # rotation order
+        self._waiting = 0
+        self._running = 0
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, session: str, fn: Callable) -> Ticket:
+        """Queue `fn()` for `session`; raises QueueFull when max_queue jobs are waiting."""
+        with self._cond:
+            if self._waiting >= self.max_queue:
+                raise QueueFull(f"{self._waiting} jobs are already waiting")
+            ticket = Ticket(session, fn)
+            queue = self._queues.get(session)
+            if queue is None:
+                queue = self._queues[session] = deque()
+            queue.append(ticket)
+            self._waiting += 1
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._work, name=f"extract-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return ticket
+
+    def run(self, session: str, fn: Callable, on_wait: Optional[Callable[[int], None]] = None,
+            poll: float = 0.5):
+        """
+        submit() and block until `fn()` is done; returns its result. While the
+        job waits, on_wait(jobs ahead of it) is called every `poll` seconds.
+        If the caller is interrupted (e.g. Streamlit stops the script run),
+        a job that has not started yet is dropped.
+        """
+        ticket = self.submit(session, fn)
+        try:
+            while not ticket.wait(poll if on_wait is not None else None):
+                if ticket.state == "queued":
+                    on_wait(self.position(ticket))
+        except BaseException:
+            self.cancel(ticket)
+            raise
+        return ticket.result()
+
+    def position(self, ticket: Ticket) -> int:
+        """How many waiting jobs will start before `ticket` (0 = next); -1 once it is no longer waiting."""
+        with self._cond:
+            queue = self._queues.get(ticket.session)
+            if ticket.state != "queued" or queue is None:
+                return -1
+            rank = queue.index(ticket)  # full rounds before this job's turn
+            ahead = rank
+            before = True  # sessions ahead in the rotation get one more turn first
+            for session, other in self._queues.items():
+                if session == ticket.session:
+                    before = False
+                    continue
+                ahead += min(len(other), rank + 1 if before else rank)
+            return ahead
+
+    def cancel(self, ticket: Ticket) -> bool:
+        """Drop a job that has not started; True if it was dropped."""
+        with self._cond:
+            if ticket.state != "queued":
+                return False
+            queue = self._queues[ticket.session]
+            queue.remove(ticket)
+            if not queue:
+                del self._queues[ticket.session]
+            self._waiting -= 1
+            ticket.state = "cancelled"
+        ticket._done.set()
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "running": self._running,
+                "waiting": self._waiting,
+                "sessions_waiting": len(self._queues),
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+            }
+
+    def _next(self) -> Ticket:
+        session, queue = next(iter(self._queues.items()))
+        ticket = queue.popleft()
+        if queue:
+            self._queues.move_to_end(session)
+        else:
+            del self._queues[session]
+        self._waiting -= 1
+        return ticket
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queues:
+                    self._cond.wait()
+                ticket = self._next()
+                ticket.state = "running"
+                ticket.started = time.monotonic()
+                self._running += 1
+            try:
+                ticket._result = ticket.fn()
+            except BaseException as e:  # handed to the caller by result()
+                ticket._error = e
+            finally:
+                with self._cond:
+                    self._running -= 1
+                ticket.state = "done"
+                ticket._done.set()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    return max(int(value), 1) if value else default
+
+
+_executor: Optional[FairExecutor] = None
+_ocr_slots: Optional[threading.BoundedSemaphore] = None
+_lock = threading.Lock()
+
+
+def get_executor() -> FairExecutor:
+    """
+    The executor shared by every session in this process. RESUME_EXTRACT_WORKERS
+    (default: CPU count, at most 4) and RESUME_EXTRACT_QUEUE (default 32) tune it.
+    """
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = FairExecutor(
+                max_workers=_env_int("RESUME_EXTRACT_WORKERS", min(os.cpu_count() or 1, 4)),
+                max_queue=_env_int("RESUME_EXTRACT_QUEUE", 32),
+            )
+        return _executor
+
+
+def get_ocr_slots() -> threading.BoundedSemaphore:
+    """
+    Semaphore every Tesseract call in this process holds while it runs.
+    RESUME_OCR_CONCURRENCY (default: CPU count) sets how many may run at once.
+    """
+    global _ocr_slots
+    with _lock:
+        if _ocr_slots is None:
+            _ocr_slots = threading.BoundedSemaphore(_env_int("RESUME_OCR_CONCURRENCY", os.cpu_count() or 1))
+        return _ocr_slots
@@ -1,87 +1,657 @@
+import importlib.util
 import io
+import os
 import re
-import fitz  # PyMuPDF
-import pytesseract
-from PIL import Image
-from pdfminer.high_level import extract_text
+import sys
+import threading
+from collections import deque
+from itertools import islice
+from typing import Dict, Iterator, NamedTuple, Optional
 
+from budget import Budget, BudgetExceeded, BudgetTracker, default_budget, get_ocr_breaker
+from diagnostics import Diagnostics, stage
+from executor import get_ocr_slots
+from ingest import open_pdf_source
 
-# 🪟 Optional: specify tesseract path (only if OCR fails)
-# pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+# PyMuPDF, pytesseract/tesserocr, Pillow and pdfminer are imported inside the functions
+# that use them, so importing this module (e.g. for clean_text) stays cheap.
 
+# Pages with fewer characters than this are OCR'd
+OCR_MIN_CHARS = 100
+# If the whole PyMuPDF pass yields fewer characters than this, pdfminer gets a try
+PDFMINER_MIN_CHARS = 500
+# OCR triage: images must cover this share of the page to be worth OCR-ing,
+# a page without text or images needs this many vector paths to count as outlined text
+IMAGE_MIN_COVERAGE = 0.02
+VECTOR_TEXT_MIN_PATHS = 50
+OCR_MIN_DPI = 150
+OCR_MAX_DPI = 300
 
-def extract_text_from_pdf(uploaded_file):
+
+class Extraction(NamedTuple):
+    text: str
+    ocr_used: bool
+    page_count: int
+    truncated: Optional[str] = None  # limit that cut the text short (see budget.py), else None
+
+
+class PDFReadError(Exception):
+    """Neither PyMuPDF nor pdfminer could read the file (not a PDF, empty, corrupt)."""
+
+
+class PageText(NamedTuple):
+    page_number: int  # 1-based
+    page_count: int   # pages in the document (0 if PyMuPDF could not open it)
+    text: str         # raw page text, before clean_text
+    method: str       # "native", "ocr" or "pdfminer"
+
+
+def _tesseract():
+    """pytesseract, imported on the first OCR call."""
+    import pytesseract
+
+    # 🪟 Optional: specify tesseract path (only if OCR fails)
+    # pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+    return pytesseract
+
+
+# ---------- OCR backends ---------- #
+
+# "auto" uses the persistent engine when tesserocr is installed, else pytesseract
+OCR_BACKENDS = ("auto", "tesserocr", "pytesseract")
+OCR_LANG = os.environ.get("RESUME_OCR_LANG", "eng")
+
+
+class PytesseractBackend:
+    """
+    One tesseract process per page: the image is written to a temp file and
+    the language model is loaded again every call. Works wherever the
+    tesseract binary is on PATH, and the process can be killed at a timeout.
+    """
+    name = "pytesseract"
+
+    def __init__(self, lang: str = OCR_LANG):
+        self.lang = lang
+        self._module = _tesseract()
+
+    def image_to_string(self, image, timeout: float = 0) -> str:
+        return self._module.image_to_string(image, lang=self.lang, timeout=timeout)
+
+
+class TesserocrBackend:
+    """
+    Persistent Tesseract engines (tesserocr's PyTessBaseAPI) that OCR PIL
+    images from memory. An engine loads the model once and is reused for
+    every later page in the process; engines are not thread-safe, so OCR
+    threads borrow one each from a pool that grows to the number of threads
+    used at once. A timeout cancels recognition inside the engine.
+    """
+    name = "tesserocr"
+
+    def __init__(self, lang: str = OCR_LANG):
+        import tesserocr
+
+        self.lang = lang
+        self._tesserocr = tesserocr
+        self._idle = []
+        self._lock = threading.Lock()
+        self._release(self._new_engine())  # fail now (missing tessdata...) rather than per page
+
+    def _new_engine(self):
+        return self._tesserocr.PyTessBaseAPI(lang=self.lang)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._new_engine()
+
+    def _release(self, engine) -> None:
+        engine.Clear()  # drop the page image and results, keep the model
+        with self._lock:
+            self._idle.append(engine)
+
+    def image_to_string(self, image, timeout: float = 0) -> str:
+        engine = self._acquire()
+        try:
+            engine.SetImage(image)
+            if not engine.Recognize(timeout=int(timeout * 1000)):
+                # "timeout" in the message, as from pytesseract, marks the page as out of time
+                raise RuntimeError("Tesseract process timeout" if timeout else "Tesseract recognition failed")
+            text = engine.GetUTF8Text()
+        except Exception:
+            engine.End()  # an engine in an unknown state is not reused
+            raise
+        self._release(engine)
+        # The tesseract CLI ends its output with a form feed (page separator)
+        return text + "\f"
+
+
+_ocr_backends = {}
+_ocr_backends_lock = threading.Lock()
+
+
+def get_ocr_backend(name: Optional[str] = None):
+    """
+    The OCR backend this process uses, created once. `name` (default:
+    RESUME_OCR_BACKEND, else "auto") is one of OCR_BACKENDS; "auto" falls
+    back to pytesseract when tesserocr is missing or cannot load the model.
+    """
+    name = (name or os.environ.get("RESUME_OCR_BACKEND") or "auto").lower()
+    if name not in OCR_BACKENDS:
+        raise ValueError(f"unknown OCR backend {name!r}; choose from {OCR_BACKENDS}")
+    with _ocr_backends_lock:
+        backend = _ocr_backends.get(name)
+        if backend is None:
+            if name == "tesserocr":
+                backend = TesserocrBackend()
+            elif name == "pytesseract":
+                backend = PytesseractBackend()
+            else:
+                try:
+                    backend = TesserocrBackend()
+                except Exception:
+                    backend = PytesseractBackend()
+            _ocr_backends[name] = backend
+        return backend
+
+
+def ocr_settings() -> Dict[str, str]:
+    """
+    The OCR language and backend name, for cache keys: either changes the
+    text OCR'd pages come out with. Does not create the backend; "auto"
+    names tesserocr when it is installed (as get_ocr_backend would pick it).
+    """
+    name = (os.environ.get("RESUME_OCR_BACKEND") or "auto").lower()
+    if name == "auto":
+        name = "tesserocr" if importlib.util.find_spec("tesserocr") is not None else "pytesseract"
+    return {"ocr_lang": OCR_LANG, "ocr_backend": name}
+
+
+class PageTriage(NamedTuple):
+    kind: str    # "text", "image", "mixed" or "blank"
+    clip: Optional[tuple]  # region worth OCR-ing (x0, y0, x1, y1), None = whole page
+    dpi: int     # render resolution for OCR
+
+
+def triage_page(page, page_text: str = "") -> PageTriage:
+    """
+    Classify a low-text page from cheap PyMuPDF metadata, without rendering it.
+      text  - has fonts/text blocks and no meaningful images (e.g. a sparse last page)
+      image - no usable text but images (a scan) or lots of vector paths (outlined text)
+      mixed - a little text plus images that may hold the rest
+      blank - nothing to read
+    For image/mixed pages the clip is the union of the image areas and the DPI
+    follows the images' own resolution, clamped to OCR_MIN_DPI..OCR_MAX_DPI.
+    """
+    page_rect = page.rect
+    page_area = abs(page_rect) or 1.0
+
+    clip = None
+    covered = 0.0
+    best_dpi = 0.0
+    for info in page.get_image_info():
+        bbox = page_rect & info["bbox"]
+        if bbox.is_empty:
+            continue
+        covered += abs(bbox)
+        clip = bbox if clip is None else clip | bbox
+        if bbox.width > 0:
+            best_dpi = max(best_dpi, info.get("width", 0) / (bbox.width / 72))
+    coverage = min(covered / page_area, 1.0)
+
+    has_text = bool(page_text.strip())
+    has_fonts = bool(page.get_fonts())
+
+    if coverage >= IMAGE_MIN_COVERAGE:
+        kind = "mixed" if has_text else "image"
+    elif has_text or has_fonts:
+        kind = "text"
+    elif len(page.get_drawings()) >= VECTOR_TEXT_MIN_PATHS:
+        kind, clip = "image", None
+    else:
+        kind = "blank"
+
+    dpi = int(min(max(best_dpi or OCR_MAX_DPI, OCR_MIN_DPI), OCR_MAX_DPI))
+    return PageTriage(kind, tuple(clip) if clip is not None else None, dpi)
+
+
+def _render_for_ocr(page, triage: PageTriage, tracker: Optional[BudgetTracker] = None,
+                    diagnostics: Optional[Diagnostics] = None):
+    """
+    Rasterize only the triaged region, in grayscale, into a PIL image for Tesseract.
+    The DPI is lowered to keep the image within the tracker's max_pixmap_bytes;
+    returns None when that would make it too coarse to read.
+    """
+    import fitz  # PyMuPDF
+    from PIL import Image
+
+    clip = fitz.Rect(triage.clip) if triage.clip is not None else None
+    dpi = triage.dpi
+    if tracker is not None:
+        region = clip if clip is not None else page.rect
+        dpi = tracker.fit_dpi(region.width, region.height, dpi, OCR_MIN_DPI)
+        if dpi is None:
+            return None
+        if diagnostics is not None and dpi < triage.dpi:
+            diagnostics.count("pixmaps_downscaled")
+    pix = page.get_pixmap(dpi=dpi, clip=clip, colorspace=fitz.csGRAY, alpha=False)
+    img = Image.frombytes("L", [pix.width, pix.height], pix.samples)
+    return img
+
+
+def _ocr(image, tracker: Optional[BudgetTracker] = None) -> Optional[str]:
+    """
+    Tesseract text of one page image, or None if OCR is switched off (open
+    circuit breaker), failed or ran out of time. Waits for a free OCR slot
+    (executor.get_ocr_slots) first; waiting and recognition both stop at the
+    document's deadline. Safe to call from OCR threads.
+    """
+    slots = get_ocr_slots()
+    if not slots.acquire(timeout=tracker.remaining() if tracker is not None else None):
+        tracker.mark("max_seconds")
+        return None
+    try:
+        return _run_ocr(image, tracker)
+    finally:
+        slots.release()
+
+
+def _run_ocr(image, tracker: Optional[BudgetTracker]) -> Optional[str]:
+    # Deadline first: a call that allow() lets through (maybe the breaker's
+    # half-open trial) must go on to report success or failure
+    timeout = tracker.remaining() if tracker is not None else None
+    if timeout is not None and timeout <= 0:
+        tracker.mark("max_seconds")
+        return None
+    breaker = get_ocr_breaker()
+    if not breaker.allow():
+        if tracker is not None:
+            tracker.mark("ocr_unavailable")
+        return None
+    try:
+        text = get_ocr_backend().image_to_string(image, timeout=timeout or 0)
+    except Exception as e:
+        if timeout and "timeout" in str(e).lower():
+            # the document's own deadline, not a sign that Tesseract is broken
+            breaker.release_trial()
+            tracker.mark("max_seconds")
+            return None
+        breaker.record_failure()
+        if tracker is not None:
+            tracker.mark("ocr_failed")
+        return None
+    breaker.record_success()
+    return text
+
+
+def _prepare_page(page, diagnostics: Optional[Diagnostics], tracker: Optional[BudgetTracker] = None):
+    """
+    (text to keep, image to OCR or None) for one page. Runs on the calling
+    thread: PyMuPDF is not thread-safe.
+    """
+    # ✅ Try normal text extraction
+    page_text = page.get_text("text")
+    if len(page_text.strip()) >= OCR_MIN_CHARS:
+        return page_text, None
+
+    # 🧠 Little or no text: decide cheaply whether OCR can help before rendering
+    triage = triage_page(page, page_text)
+    if diagnostics is not None:
+        diagnostics.count("pages_triage_" + triage.kind)
+    if triage.kind in ("text", "blank"):
+        return page_text, None
+    if tracker is not None and not tracker.take_ocr_page():
+        return page_text, None
+
+    image = _render_for_ocr(page, triage, tracker, diagnostics)
+    if image is None:
+        return page_text, None
+    prefix = page_text if triage.kind == "mixed" else ""
+    return prefix, image
+
+
+def iter_pdf_pages(uploaded_file, ocr_workers: int = 0, max_pages: Optional[int] = None,
+                   max_chars: Optional[int] = None,
+                   diagnostics: Optional[Diagnostics] = None,
+                   budget: Optional[BudgetTracker] = None) -> Iterator[PageText]:
+    """
+    Yield one PageText per page, in page order, as soon as it is extracted.
+
+    PyMuPDF text first, OCR for pages with little text. If the PyMuPDF pass
+    ran to the end and produced under PDFMINER_MIN_CHARS characters, its pages
+    are followed by pdfminer pages (method "pdfminer") that replace them.
+    Stops after `max_pages` pages or once `max_chars` characters were yielded;
+    closing the generator early stops all work.
+
+    uploaded_file may be a path, bytes-like object or binary file object
+    (see ingest.open_pdf_source); files on disk are memory-mapped.
+
+    diagnostics, if given, counts bytes, pages, OCR pages and pdfminer fallbacks.
+
+    budget (from Budget.start()) limits time, pages, OCR pages and render
+    size for this document. When a limit is hit the pages read so far are
+    kept and budget.truncated names the limit; a page whose OCR was skipped
+    or failed keeps its native text. Without a budget nothing is limited.
+
+    Raises PDFReadError when neither PyMuPDF nor pdfminer can read the file.
+    """
+    page_count = 0
+    pages_done = 0
+    chars_done = 0
+    cut_off = False
+    stripped = _StrippedLength()
+    fitz_error = None
+
+    # one buffer for both parsers: mapped from disk or viewed in place, never copied whole
+    with open_pdf_source(uploaded_file) as source:
+        if diagnostics is not None:
+            diagnostics.count("bytes", len(source))
+
+        try:
+            pdf_doc = _open_fitz(source.buffer)
+            try:
+                page_count = pdf_doc.page_count
+                for i, page_text, method in _iter_fitz_pages(pdf_doc, ocr_workers, diagnostics, budget):
+                    stripped.add(page_text + "\n\n")
+                    pages_done += 1
+                    chars_done += len(page_text)
+                    if diagnostics is not None:
+                        diagnostics.count("pages")
+                        if method == "ocr":
+                            diagnostics.count("pages_ocr")
+                    yield PageText(i + 1, page_count, page_text, method)
+                    if _over_limit(pages_done, chars_done, max_pages, max_chars):
+                        cut_off = True
+                        return
+            finally:
+                pdf_doc.close()
+
+        except Exception as e:
+            print("PyMuPDF extraction failed:", e, file=sys.stderr)
+            fitz_error = e
+            if diagnostics is not None:
+                diagnostics.count("pymupdf_errors")
+
+        # ✅ If PyMuPDF didn’t capture enough, try pdfminer
+        if cut_off or stripped.length >= PDFMINER_MIN_CHARS:
+            return
+        if budget is not None and budget.expired():
+            budget.mark("max_seconds")
+            return
+        if diagnostics is not None:
+            diagnostics.count("pdfminer_fallback")
+        try:
+            pages_done = chars_done = 0
+            for i, page_text in enumerate(_iter_pdfminer_pages(source.reader(), budget)):
+                pages_done += 1
+                chars_done += len(page_text)
+                if diagnostics is not None:
+                    diagnostics.count("pdfminer_pages")
+                yield PageText(i + 1, page_count, page_text, "pdfminer")
+                if _over_limit(pages_done, chars_done, max_pages, max_chars):
+                    return
+                if budget is not None and not budget.pages_left(pages_done):
+                    if not page_count or page_count > pages_done:
+                        budget.mark("max_pages")
+                    return
+        except BudgetExceeded:
+            pass  # pages so far are kept; budget.truncated says why
+        except Exception as e:
+            print("pdfminer fallback failed:", e, file=sys.stderr)
+            if diagnostics is not None:
+                diagnostics.count("pdfminer_errors")
+            if fitz_error is not None and not page_count and pages_done == 0:
+                raise PDFReadError(f"not a readable PDF (PyMuPDF: {fitz_error}; pdfminer: {e})") from e
+
+
+def _open_fitz(buffer: memoryview):
+    import fitz  # PyMuPDF
+
+    try:
+        return fitz.open(stream=buffer, filetype="pdf")
+    except TypeError:
+        # PyMuPDF versions that only take bytes
+        return fitz.open(stream=bytes(buffer), filetype="pdf")
+
+
+def extract_text_from_pdf(uploaded_file, ocr_workers: int = 0,
+                          diagnostics: Optional[Diagnostics] = None,
+                          budget: Optional[Budget] = None) -> Extraction:
     """
     Extracts text from any kind of resume (text, scanned, or hybrid PDFs).
     Combines PyMuPDF, pdfminer, and OCR for maximum reliability.
-    Returns full cleaned text.
+    Returns Extraction(text, ocr_used, page_count, truncated) with the full cleaned text.
+
+    ocr_workers > 1 sends the pages that need OCR to a pool of that many
+    threads (Tesseract runs as a subprocess, so threads overlap fine);
+    the text is still put back together in page order.
+    diagnostics, if given, gets per-stage timings and page counters.
+    budget limits the work on this document (default: budget.default_budget());
+    if a limit was hit, the text is what was read until then and `truncated`
+    names the limit. Raises PDFReadError if the file cannot be read as a PDF.
     """
-    text = ""
+    native_pages = []
+    pdfminer_pages = []
     ocr_used = False  # flag for debugging or reporting
+    page_count = 0
+    tracker = (budget if budget is not None else default_budget()).start()
+
+    with stage(diagnostics, "extract_pages"):
+        for page in iter_pdf_pages(uploaded_file, ocr_workers=ocr_workers, diagnostics=diagnostics,
+                                   budget=tracker):
+            page_count = page.page_count
+            if page.method == "pdfminer":
+                pdfminer_pages.append(page.text)
+            else:
+                native_pages.append(page.text)
+                ocr_used = ocr_used or page.method == "ocr"
+
+    # pdfminer ends every page with a form feed
+    if pdfminer_pages:
+        text = "".join(t + "\f" for t in pdfminer_pages)
+    else:
+        text = "".join(t + "\n\n" for t in native_pages)
+
+    with stage(diagnostics, "clean_text"):
+        clean = clean_text(text)
+    if diagnostics is not None and tracker.truncated is not None:
+        diagnostics.count("truncated_" + tracker.truncated)
+    return Extraction(clean.strip(), ocr_used, page_count, tracker.truncated)
+
+
+def _over_limit(pages, chars, max_pages, max_chars) -> bool:
+    return (max_pages is not None and pages >= max_pages) or \
+        (max_chars is not None and chars >= max_chars)
+
+
+class _StrippedLength:
+    """len(text.strip()) of a string built by appending chunks, without keeping it."""
+
+    def __init__(self):
+        self.total = 0
+        self.first = None  # offset of first non-whitespace char
+        self.end = 0       # offset just past the last non-whitespace char
 
+    def add(self, chunk: str) -> None:
+        body = chunk.strip()
+        if body:
+            lead = len(chunk) - len(chunk.lstrip())
+            if self.first is None:
+                self.first = self.total + lead
+            self.end = self.total + lead + len(body)
+        self.total += len(chunk)
+
+    @property
+    def length(self) -> int:
+        return 0 if self.first is None else self.end - self.first
+
+
+def _iter_fitz_pages(pdf_doc, ocr_workers: int, diagnostics: Optional[Diagnostics] = None,
+                     budget: Optional[BudgetTracker] = None):
+    """
+    (index, text, method) for every page in order. With ocr_workers > 1 the
+    OCR calls run on a thread pool while later pages are read ahead; pages are
+    rendered on the calling thread and at most 2 * ocr_workers pages are held
+    back waiting for their text. With a budget, stops at its page limit or
+    deadline (OCR still running then is killed at the deadline too).
+    """
+    pages = pdf_doc
+    limited = budget is not None and budget.budget.max_pages is not None \
+        and pdf_doc.page_count > budget.budget.max_pages
+    if limited:
+        pages = islice(pdf_doc, budget.budget.max_pages)
+
+    def out_of_time():
+        if budget is not None and budget.expired():
+            budget.mark("max_seconds")
+            return True
+        return False
+
+    if not ocr_workers or ocr_workers < 2:
+        for i, page in enumerate(pages):
+            if out_of_time():
+                return
+            page_text, image = _prepare_page(page, diagnostics, budget)
+            if image is None:
+                yield i, page_text, "native"
+            else:
+                yield _with_ocr(i, page_text, _ocr(image, budget), diagnostics)
+        if limited:
+            budget.mark("max_pages")
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    window = deque()  # (index, text, Future or None), oldest page first
+    pool = ThreadPoolExecutor(max_workers=ocr_workers)
     try:
-        uploaded_file.seek(0)
-        pdf_doc = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-        page_count = pdf_doc.page_count
+        for i, page in enumerate(pages):
+            if out_of_time():
+                break
+            page_text, image = _prepare_page(page, diagnostics, budget)
+            future = None
+            if image is not None:
+                future = pool.submit(_ocr, image, budget)
+            window.append((i, page_text, future))
+            del image
 
-        for i, page in enumerate(pdf_doc):
-            # ✅ Try normal text extraction
-            page_text = page.get_text("text")
+            # hand out every page at the head that is ready; block only when the window is full
+            while window and (len(window) >= ocr_workers * 2 or _is_ready(window[0][2])):
+                yield _resolve(window.popleft(), diagnostics)
 
-            # 🧠 Fallback: OCR if page has little or no text
-            if len(page_text.strip()) < 100:
-                ocr_used = True
-                pix = page.get_pixmap(dpi=300)
-                img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                page_text = pytesseract.image_to_string(img)
+        while window:
+            yield _resolve(window.popleft(), diagnostics)
+        if limited:
+            budget.mark("max_pages")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
-            text += page_text + "\n\n"
 
-        pdf_doc.close()
+def _is_ready(future) -> bool:
+    return future is None or future.done()
 
-    except Exception as e:
-        print("PyMuPDF extraction failed:", e)
 
-    # ✅ If PyMuPDF didn’t capture enough, try pdfminer
-    if len(text.strip()) < 500:
-        try:
-            uploaded_file.seek(0)
-            text = extract_text(uploaded_file)
-        except Exception as e:
-            print("pdfminer fallback failed:", e)
+def _resolve(entry, diagnostics: Optional[Diagnostics] = None):
+    i, page_text, future = entry
+    if future is None:
+        return i, page_text, "native"
+    return _with_ocr(i, page_text, future.result(), diagnostics)
+
 
-    clean = clean_text(text)
-    return clean.strip(), ocr_used, page_count
+def _with_ocr(i, page_text, ocr_text: Optional[str], diagnostics: Optional[Diagnostics] = None):
+    if ocr_text is None:  # skipped or failed: keep the native text
+        if diagnostics is not None:
+            diagnostics.count("ocr_skipped")
+        return i, page_text, "native"
+    return i, page_text + ocr_text, "ocr"
+
+
+def _iter_pdfminer_pages(fp, budget: Optional[BudgetTracker] = None) -> Iterator[str]:
+    """
+    Page-at-a-time version of pdfminer.high_level.extract_text: the same
+    converter and layout settings, so the pages joined with form feeds
+    equal extract_text(fp). With a budget, raises BudgetExceeded at its
+    deadline, checked between pages and every 1024 glyphs or paths within one.
+    """
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    class BudgetedTextConverter(TextConverter):
+        ticks = 0
+
+        def render_char(self, *args, **kwargs):
+            self.ticks += 1
+            if not self.ticks & 1023:
+                budget.check()
+            return super().render_char(*args, **kwargs)
+
+        def paint_path(self, *args, **kwargs):
+            self.ticks += 1
+            if not self.ticks & 1023:
+                budget.check()
+            return super().paint_path(*args, **kwargs)
+
+    with io.StringIO() as output:
+        rsrcmgr = PDFResourceManager(caching=True)
+        converter = BudgetedTextConverter if budget is not None else TextConverter
+        device = converter(rsrcmgr, output, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.get_pages(fp, caching=True):
+            if budget is not None:
+                budget.check()
+            interpreter.process_page(page)
+            page_text = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            yield page_text[:-1] if page_text.endswith("\f") else page_text
+
+
+# ---------- clean_text ---------- #
+#
+# Same output as the original multi-pass version (junk regex, two whitespace
+# regexes, a dict of str.replace calls, the "Univers" regex) in three passes.
+# The typographic replacements of that dict (dashes, bullets, ligatures, curly
+# quotes...) never fired: those characters are junk and were already turned
+# into spaces by the first pass. Only " ," " ." and " - " ever matched.
+
+# Characters that survive cleaning, apart from whitespace
+_KEEP = r"A-Za-z0-9.,;:@/\-()&%+*"
+
+# A "run" is a maximal stretch of junk and/or whitespace. Runs that are a single
+# whitespace character are left alone; every other run becomes one space, or one
+# newline if it is made of newlines only. That is what junk -> " " followed by
+# the two whitespace regexes produced. The pattern starts with a plain character
+# class so the regex engine can skip ordinary text quickly.
+_RUN_RE = re.compile(rf"[^{_KEEP}](?:[^{_KEEP}]+|(?<=[^{_KEEP}\s]))")
+
+# " ," -> ","  " ." -> "."  " - " -> "-", with the old replace order kept:
+# " - " followed by , or . loses to the earlier " ," / " ." replacement
+_PUNCT_RE = re.compile(r" ([,.])| - (?![,.])")
+
+# Fix truncated "Univers..." etc. (same as \bUnivers\.*\b, but starts with a literal)
+_UNIVERS_RE = re.compile(r"univers(?<=\bunivers)\.*\b", re.IGNORECASE)
+
+
+def _run_sub(match) -> str:
+    run = match.group()
+    return "\n" if run[0] == "\n" and not run.strip("\n") else " "
+
+
+def _punct_sub(match) -> str:
+    return match.group(1) or "-"
 
 
 def clean_text(text: str) -> str:
     """Smart cleaning: removes symbols, fixes spacing and broken words."""
-    # Remove unreadable artifacts or junk chars
-    text = re.sub(r"[^A-Za-z0-9.,;:@/\-\n\s()&%+*]+", " ", text)
-
-    # Normalize whitespace
-    text = re.sub(r"\n+", "\n", text)
-    text = re.sub(r"\s{2,}", " ", text)
+    # Remove unreadable artifacts or junk chars + normalize whitespace
+    text = _RUN_RE.sub(_run_sub, text)
 
     # Common cleanup replacements
-    replacements = {
-        " ,": ",",
-        " .": ".",
-        " - ": "-",
-        "–": "-",
-        "—": "-",
-        "…": "",
-        "•": "",
-        "§": "",
-        "ï": "",
-        "’": "'",
-        "ﬁ": "fi",
-        "ﬂ": "fl",
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-
-    # Fix truncated "Univers..." etc.
-    text = re.sub(r"\bUnivers\.*\b", "University", text, flags=re.IGNORECASE)
+    text = _PUNCT_RE.sub(_punct_sub, text)
+
+    text = _UNIVERS_RE.sub("University", text)
 
     return text.strip()
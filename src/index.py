@@ -0,0 +1,174 @@
+# src/index.py
+import heapq
+import json
+import math
+import re
+import sqlite3
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from nlp import get_skill_matcher
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "is", "it", "of", "on", "or", "our", "the", "to", "we", "will", "with",
+    "you", "your", "this", "that", "who", "can", "all", "any", "etc",
+}
+
+# Detected skills are stored as extra terms ("skill:python") and weighted up in queries
+SKILL_PREFIX = "skill:"
+SKILL_WEIGHT = 2.0
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens (keeps c++, c#, node.js) without stopwords."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+class ResumeIndex:
+    """
+    On-disk inverted index (SQLite) over extracted resume text + detected skills,
+    ranked with BM25. Documents can be added at any time; a query only reads the
+    postings of its own terms, never the documents themselves.
+    """
+
+    def __init__(self, path: str, k1: float = 1.2, b: float = 0.75):
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS docs (
+                doc_id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL UNIQUE,
+                length INTEGER NOT NULL,
+                meta TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                doc_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (term, doc_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+            CREATE TABLE IF NOT EXISTS terms (
+                term TEXT PRIMARY KEY,
+                df INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO stats VALUES ('docs', 0), ('total_length', 0);
+            """
+        )
+        self._db.commit()
+
+    # ---------- writing ---------- #
+
+    def add(self, key: str, text: str, skills: Iterable[str] = (),
+            meta: Optional[Dict] = None, commit: bool = True) -> None:
+        """Index one resume under `key` (path or content hash); replaces an existing entry."""
+        self._remove(key)
+
+        counts = Counter(tokenize(text))
+        for skill in skills:
+            counts[SKILL_PREFIX + skill.lower()] = 1
+        length = sum(counts.values())
+
+        cur = self._db.execute(
+            "INSERT INTO docs (key, length, meta) VALUES (?, ?, ?)",
+            (key, length, json.dumps(meta or {}, ensure_ascii=False)),
+        )
+        doc_id = cur.lastrowid
+        self._db.executemany(
+            "INSERT INTO postings VALUES (?, ?, ?)",
+            ((term, doc_id, tf) for term, tf in counts.items()),
+        )
+        self._db.executemany(
+            "INSERT INTO terms VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+            ((term,) for term in counts),
+        )
+        self._bump_stats(1, length)
+        if commit:
+            self._db.commit()
+
+    def _remove(self, key: str) -> None:
+        row = self._db.execute("SELECT doc_id, length FROM docs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return
+        doc_id, length = row
+        self._db.execute(
+            "UPDATE terms SET df = df - 1 WHERE term IN (SELECT term FROM postings WHERE doc_id = ?)",
+            (doc_id,),
+        )
+        self._db.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+        self._db.execute("DELETE FROM docs WHERE doc_id = ?", (doc_id,))
+        self._bump_stats(-1, -length)
+
+    def _bump_stats(self, docs: int, length: int) -> None:
+        self._db.execute("UPDATE stats SET value = value + ? WHERE name = 'docs'", (docs,))
+        self._db.execute("UPDATE stats SET value = value + ? WHERE name = 'total_length'", (length,))
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- reading ---------- #
+
+    def __len__(self) -> int:
+        return self._stat("docs")
+
+    def _stat(self, name: str) -> int:
+        return self._db.execute("SELECT value FROM stats WHERE name = ?", (name,)).fetchone()[0]
+
+    def query_terms(self, job_description: str) -> Dict[str, float]:
+        """Weighted query terms for a job description: words + detected skills."""
+        weights: Dict[str, float] = dict.fromkeys(tokenize(job_description), 1.0)
+        for skill, _category in get_skill_matcher().find(job_description.lower()):
+            weights[SKILL_PREFIX + skill.lower()] = SKILL_WEIGHT
+        return weights
+
+    def search(self, job_description: str, k: int = 10) -> List[Tuple[float, str, Dict]]:
+        """Top-k (score, key, meta) for a job description, best first."""
+        n_docs = self._stat("docs")
+        if not n_docs:
+            return []
+        avg_length = self._stat("total_length") / n_docs
+        k1, b = self.k1, self.b
+
+        scores: Dict[int, float] = {}
+        for term, weight in self.query_terms(job_description).items():
+            row = self._db.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+            if row is None or row[0] <= 0:
+                continue
+            df = row[0]
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+            for doc_id, tf, length in self._db.execute(
+                "SELECT p.doc_id, p.tf, d.length FROM postings p JOIN docs d USING (doc_id)"
+                " WHERE p.term = ?", (term,)
+            ):
+                norm = tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_length))
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf * norm
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        results = []
+        for doc_id, score in top:
+            key, meta = self._db.execute(
+                "SELECT key, meta FROM docs WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+            results.append((round(score, 4), key, json.loads(meta)))
+        return results
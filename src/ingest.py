@@ -0,0 +1,124 @@
+# src/ingest.py
+import io
+import mmap
+import os
+import stat
+from typing import Callable, Optional
+
+
+class PDFSource:
+    """
+    A PDF's bytes as one read-only buffer (`buffer`, a memoryview), shared by
+    PyMuPDF and the pdfminer fallback. Files on disk are memory-mapped, so
+    pages are only read in when a parser touches them; in-memory uploads are
+    viewed in place. Use as a context manager, or call close().
+    """
+
+    def __init__(self, buffer: memoryview, release: Optional[Callable[[], None]] = None):
+        self.buffer = buffer
+        self._release = release
+
+    def __len__(self) -> int:
+        return self.buffer.nbytes
+
+    def reader(self) -> "BufferReader":
+        """A seekable file object over the buffer (for pdfminer), reading without a full copy."""
+        return BufferReader(self.buffer)
+
+    def close(self) -> None:
+        if self._release is not None:
+            release, self._release = self._release, None
+            try:
+                self.buffer.release()
+                release()
+            except BufferError:
+                pass  # a parser still holds the buffer; it is freed with that parser
+
+    def __enter__(self) -> "PDFSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BufferReader(io.RawIOBase):
+    """Read-only, seekable file over a memoryview; read(n) copies only those n bytes."""
+
+    def __init__(self, buffer: memoryview):
+        super().__init__()
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        chunk = self._buffer[self._pos:self._pos + len(b)]
+        n = chunk.nbytes
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._buffer.nbytes + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def _map_file(f) -> PDFSource:
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return PDFSource(memoryview(b""))  # empty files cannot be mapped
+    view = memoryview(mapped)
+    return PDFSource(view, mapped.close)
+
+
+def open_pdf_source(source) -> PDFSource:
+    """
+    PDFSource for a path, a buffer-protocol object (bytes, bytearray,
+    memoryview, mmap), an io.BytesIO (Streamlit's UploadedFile is one) or any
+    binary file object. Only a file object that is neither mapped nor a
+    BytesIO is read into memory.
+    """
+    if isinstance(source, PDFSource):
+        return PDFSource(source.buffer)  # borrowed: closing it leaves `source` open
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return _map_file(f)  # the mapping stays valid after the file is closed
+
+    if isinstance(source, io.BytesIO):
+        # A BytesIO built from bytes (uploads are) hands back those same bytes here;
+        # getbuffer() would have to copy them first to allow writes.
+        return PDFSource(memoryview(source.getvalue()))
+
+    try:
+        return PDFSource(memoryview(source).cast("B"))
+    except TypeError:
+        pass
+
+    try:
+        regular_file = stat.S_ISREG(os.fstat(source.fileno()).st_mode)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        regular_file = False
+    if regular_file:
+        return _map_file(source)
+
+    source.seek(0)
+    return PDFSource(memoryview(source.read()))
@@ -0,0 +1,131 @@
+# src/matcher.py
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+# Bump when the automaton layout changes; to_state() data from other versions is refused
+STATE_VERSION = 1
+
+
+def _is_word(ch: str) -> bool:
+    # same definition of a "word" character as the \b in Python's re module
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over skill terms.
+
+    find() makes one linear pass over the text and reports every term that
+    occurs with regex-style word boundaries, i.e. exactly the terms for which
+    re.search(r"\\b" + re.escape(term) + r"\\b", text) would succeed.
+
+    entries: (term, skill, category) triples. `term` is what gets searched
+    for (lowercased), `skill` is what gets reported, so several terms
+    (aliases) can report the same skill.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]]):
+        self.entries: List[Tuple[str, str]] = []  # entry id -> (skill, category)
+        self._lengths: List[int] = []
+        self._first_is_word: List[bool] = []
+        self._last_is_word: List[bool] = []
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for term, skill, category in entries:
+            term = term.lower()
+            if not term:
+                continue
+            entry_id = len(self.entries)
+            self.entries.append((skill, category))
+            self._lengths.append(len(term))
+            self._first_is_word.append(_is_word(term[0]))
+            self._last_is_word.append(_is_word(term[-1]))
+
+            node = 0
+            for ch in term:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(entry_id)
+
+        # breadth-first pass: failure links + merged outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    @classmethod
+    def from_categories(cls, categories: Dict[str, List[str]]) -> "SkillMatcher":
+        """Build from a {category: [skill, ...]} mapping such as nlp.CATEGORIES."""
+        return cls(
+            (skill, skill, category)
+            for category, skills in categories.items()
+            for skill in skills
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def to_state(self) -> Tuple:
+        """The automaton as built-in containers only (marshal-able); see from_state()."""
+        return (STATE_VERSION, self.entries, self._lengths, self._first_is_word,
+                self._last_is_word, self._goto, self._fail, self._outputs)
+
+    @classmethod
+    def from_state(cls, state: Tuple) -> "SkillMatcher":
+        """Rebuild a matcher from to_state() output without re-running construction."""
+        if not state or state[0] != STATE_VERSION:
+            raise ValueError(f"unsupported matcher state version: {state[0] if state else None}")
+        matcher = cls.__new__(cls)
+        (_, matcher.entries, matcher._lengths, matcher._first_is_word, matcher._last_is_word,
+         matcher._goto, matcher._fail, matcher._outputs) = state
+        return matcher
+
+    def find_ids(self, text: str) -> List[int]:
+        """Sorted ids of every entry that occurs in `text` (already lowercased)."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        lengths = self._lengths
+        first_is_word, last_is_word = self._first_is_word, self._last_is_word
+        n = len(text)
+        found = set()
+
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not outputs[node]:
+                continue
+
+            after_is_word = i + 1 < n and _is_word(text[i + 1])
+            for entry_id in outputs[node]:
+                if entry_id in found or last_is_word[entry_id] == after_is_word:
+                    continue
+                start = i - lengths[entry_id] + 1
+                before_is_word = start > 0 and _is_word(text[start - 1])
+                if first_is_word[entry_id] != before_is_word:
+                    found.add(entry_id)
+
+        return sorted(found)
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """(skill, category) pairs found in `text`, in the order entries were given."""
+        entries = self.entries
+        return [entries[entry_id] for entry_id in self.find_ids(text)]
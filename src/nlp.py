@@ -1,7 +1,10 @@
 # src/nlp.py
-import re
+import os
 from collections import Counter
-from typing import Tuple, List, Dict, Optional
+from typing import Tuple, List, Dict, NamedTuple, Optional, Union
+
+from document import Document, as_document
+from matcher import SkillMatcher
 
 # Basic skills you can expand anytime
 TECH_SKILLS = [
@@ -22,27 +25,86 @@ CATEGORIES = {
     "Soft": SOFT_SKILLS,
 }
 
+# Path of a skills taxonomy file (see taxonomy.py) to use instead of the lists above
+TAXONOMY_ENV = "RESUME_SKILLS_TAXONOMY"
 
-def analyze_resume_text(
-    resume_text: str,
-    job_description: Optional[str] = None
-) -> Tuple[List[str], int, Dict]:
+_skill_matcher: Optional[SkillMatcher] = None
+_taxonomy_path: Optional[str] = os.environ.get(TAXONOMY_ENV) or None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """Matcher over CATEGORIES (or the active taxonomy), built on first use."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        if _taxonomy_path:
+            _load_taxonomy(_taxonomy_path)
+        else:
+            # reported names are capitalised ("Machine learning")
+            _skill_matcher = SkillMatcher(
+                (skill, skill.capitalize(), category)
+                for category, skills in CATEGORIES.items()
+                for skill in skills
+            )
+    return _skill_matcher
+
+
+def _load_taxonomy(path: str) -> None:
+    global _skill_matcher
+    from taxonomy import load_compiled_taxonomy  # only needed with a taxonomy file
+
+    categories, _skill_matcher = load_compiled_taxonomy(path)
+    # in place, so modules that imported CATEGORIES see the taxonomy too
+    CATEGORIES.clear()
+    CATEGORIES.update(categories)
+
+
+def use_taxonomy(path: Optional[str]) -> None:
     """
-    Analyze resume text:
-      - detect skills (technical + soft)
-      - compute a resume score (0-100)
-      - optionally compute job match score vs job_description
+    Detect skills from a taxonomy file (canonical names, categories, aliases)
+    instead of the built-in lists; None goes back to the built-in lists.
+    Setting RESUME_SKILLS_TAXONOMY does the same at startup.
+    """
+    global _taxonomy_path
+    _taxonomy_path = path or None
+    if not _taxonomy_path:
+        CATEGORIES.clear()
+        CATEGORIES.update({"Technical": TECH_SKILLS, "Soft": SOFT_SKILLS})
+    reset_skill_matcher()
+    if _taxonomy_path:
+        get_skill_matcher()  # load now so CATEGORIES is up to date
 
-    Returns: (skills_list, score, details_dict)
+
+def reset_skill_matcher() -> None:
+    """Call after editing CATEGORIES at runtime so the matcher is rebuilt."""
+    global _skill_matcher
+    _skill_matcher = None
+
+
+class ResumeFeatures(NamedTuple):
+    """Everything about a resume that does not depend on a job description."""
+    skills: List[str]               # reported names, in detection order
+    category_counts: Dict[str, int]
+    word_count: int
+
+    @property
+    def base_score(self) -> int:
+        """Resume score before blending in a JD match (skill count + length)."""
+        base_score = min(100, 20 + len(self.skills) * 4)
+        if self.word_count < 80:
+            base_score = max(30, base_score - 10)  # penalize too-short resumes
+        return base_score
+
+
+def extract_resume_features(resume_text: Union[str, Document]) -> ResumeFeatures:
+    """
+    The expensive, resume-only half of the analysis: skill detection,
+    category counts and word count. Compute once per document and reuse it
+    for every job description.
     """
-    text_lower = resume_text.lower()
+    document = as_document(resume_text)
 
-    found_pairs = []  # list of (skill, category)
-    for category, skills in CATEGORIES.items():
-        for skill in skills:
-            # word-boundary match
-            if re.search(r"\b" + re.escape(skill) + r"\b", text_lower):
-                found_pairs.append((skill, category))
+    # word-boundary match of every skill (and alias) in one pass: list of (skill, category)
+    found_pairs = get_skill_matcher().find(document.lower)
 
     # de-duplicate skills while preserving category counts
     seen = set()
@@ -51,16 +113,22 @@ def analyze_resume_text(
     for skill, cat in found_pairs:
         if skill not in seen:
             seen.add(skill)
-            skills_ordered.append(skill.capitalize())
+            skills_ordered.append(skill)
             cat_counter[cat] += 1
 
-    num_skills = len(skills_ordered)
-    word_count = len(resume_text.split())
+    return ResumeFeatures(skills_ordered, dict(cat_counter), document.word_count)
 
-    # base score from skill count + length
-    base_score = min(100, 20 + num_skills * 4)
-    if word_count < 80:
-        base_score = max(30, base_score - 10)  # penalize too-short resumes
+
+def match_job_description(
+    features: ResumeFeatures,
+    job_description: Optional[str] = None
+) -> Tuple[List[str], int, Dict]:
+    """
+    The cheap, JD-only half: match the resume's skills against job_description
+    and blend the match into the score. Same return value as analyze_resume_text.
+    """
+    skills_ordered = list(features.skills)
+    base_score = features.base_score
 
     # Optional job description matching
     jd_match_score = 0
@@ -77,11 +145,26 @@ def analyze_resume_text(
         base_score = int(round(base_score * 0.7 + jd_match_score * 0.3))
 
     details = {
-        "word_count": word_count,
-        "num_skills": num_skills,
-        "category_counts": dict(cat_counter),
+        "word_count": features.word_count,
+        "num_skills": len(skills_ordered),
+        "category_counts": dict(features.category_counts),
         "jd_match_score": jd_match_score,
         "jd_matched_skills": jd_matched_skills,
     }
 
     return skills_ordered, base_score, details
+
+
+def analyze_resume_text(
+    resume_text: Union[str, Document],
+    job_description: Optional[str] = None
+) -> Tuple[List[str], int, Dict]:
+    """
+    Analyze resume text:
+      - detect skills (technical + soft)
+      - compute a resume score (0-100)
+      - optionally compute job match score vs job_description
+
+    Returns: (skills_list, score, details_dict)
+    """
+    return match_job_description(extract_resume_features(resume_text), job_description)
@@ -0,0 +1,152 @@
+# src/pipeline.py
+import time
+from typing import Dict, Optional
+
+from budget import Budget
+from diagnostics import Diagnostics, stage
+from extractor import extract_text_from_pdf
+from document import Document
+from sections import detect_sections
+from nlp import analyze_resume_text
+from ats import compute_ats_breakdown
+from cache import content_hash
+from ingest import open_pdf_source
+from store import ResultsStore, job_key
+
+# read-only DedupIndex / ResultsStore per database, opened once per (worker) process
+_dedup_indexes: Dict[str, "DedupIndex"] = {}
+_results_stores: Dict[str, "ResultsStore"] = {}
+
+
+def analyze_pdf(path: str, job_description: Optional[str] = None, ocr_workers: int = 0,
+                include_text: bool = False, diagnostics: bool = False,
+                dedup: Optional[str] = None, store: Optional[str] = None,
+                budget: Optional[Budget] = None) -> Dict:
+    """
+    Run one PDF through extraction, section detection, skill analysis and
+    the ATS breakdown. Never raises: failures are reported in the record.
+
+    Returns a JSON-serialisable dict (one line of batch output).
+    include_text=True also returns the extracted text under "text";
+    diagnostics=True adds per-stage timings and counters under "diagnostics".
+    budget limits extraction (default: budget.default_budget()); a document
+    that hits a limit is analysed from the text read so far and its record
+    gets "truncated" (the limit's name).
+
+    dedup: path of a dedup.DedupIndex database. A PDF whose bytes or text are
+    already in it is not analysed: the record gets "duplicate_of" (the stored
+    key) and "similarity" instead of skills and scores. Records also carry
+    "content_hash" and, when text was extracted, the MinHash "signature"
+    (bytes) for the caller to add to the index.
+
+    store: path of a store.ResultsStore database. If it already holds a
+    successful result for these PDF bytes and job description (e.g. the file
+    was renamed), that record is returned with "from_store": true instead of
+    analysing again (not with include_text, as stored records have no text).
+    """
+    return _analyze(path, str(path), job_description, ocr_workers, include_text, diagnostics,
+                    dedup, store, budget)
+
+
+def analyze_pdf_bytes(data: bytes, job_description: Optional[str] = None, name: str = "upload.pdf",
+                      ocr_workers: int = 0, include_text: bool = False,
+                      diagnostics: bool = False, budget: Optional[Budget] = None) -> Dict:
+    """Same as analyze_pdf for a PDF already in memory (e.g. an HTTP upload); `name` goes in "path"."""
+    return _analyze(data, name, job_description, ocr_workers, include_text, diagnostics, budget=budget)
+
+
+def _get_dedup_index(path: str):
+    index = _dedup_indexes.get(path)
+    if index is None:
+        from dedup import DedupIndex  # numpy is only needed with dedup
+
+        index = _dedup_indexes[path] = DedupIndex(path, readonly=True)
+    return index
+
+
+def _get_results_store(path: str):
+    results_store = _results_stores.get(path)
+    if results_store is None:
+        results_store = _results_stores[path] = ResultsStore(path, readonly=True)
+    return results_store
+
+
+def _analyze(source, name: str, job_description: Optional[str], ocr_workers: int,
+             include_text: bool, diagnostics: bool, dedup: Optional[str] = None,
+             store: Optional[str] = None, budget: Optional[Budget] = None) -> Dict:
+    # source is a path or bytes: the extractor maps or views it without copying
+    record = {"path": name, "ok": False, "has_job_description": bool(job_description)}
+    start = time.perf_counter()
+    diag = Diagnostics() if diagnostics else None
+
+    try:
+        dedup_index = _get_dedup_index(dedup) if dedup else None
+        results_store = _get_results_store(store) if store else None
+        if dedup_index is not None or results_store is not None:
+            with open_pdf_source(source) as pdf:
+                record["content_hash"] = content_hash(pdf.buffer)
+
+        if results_store is not None and not include_text:  # a stored record has no text
+            stored = results_store.get(record["content_hash"], job_key(job_description))
+            if stored is not None:
+                stored.pop("diagnostics", None)
+                record.update(stored, from_store=True)
+                return _finish(record, start, diag)
+
+        if dedup_index is not None:
+            # identical bytes: skip extraction too
+            original = dedup_index.find_exact(record["content_hash"])
+            if original is not None:  # may be `name` itself, from an earlier run
+                record.update({"ok": True, "duplicate_of": original, "similarity": 1.0})
+                return _finish(record, start, diag)
+
+        with stage(diag, "extract"):
+            resume_text, ocr_used, pages, truncated = extract_text_from_pdf(
+                source, ocr_workers=ocr_workers, diagnostics=diag, budget=budget
+            )
+        if truncated is not None:
+            record["truncated"] = truncated
+        if dedup_index is not None:
+            with stage(diag, "dedup"):
+                signature = dedup_index.signature(resume_text)
+                matches = dedup_index.query(signature, exclude=name) if signature is not None else []
+            if signature is not None:
+                record["signature"] = signature.tobytes()
+            if matches:
+                similarity, original = matches[0]
+                record.update({"ok": True, "pages": pages, "ocr_used": ocr_used,
+                               "duplicate_of": original, "similarity": similarity})
+                return _finish(record, start, diag)
+
+        document = Document(resume_text)
+        with stage(diag, "detect_sections"):
+            sections = detect_sections(document)
+        with stage(diag, "analyze_resume_text"):
+            skills, score, details = analyze_resume_text(document, job_description)
+        with stage(diag, "compute_ats_breakdown"):
+            ats_score, ats_components = compute_ats_breakdown(details, sections)
+
+        record.update({
+            "ok": True,
+            "pages": pages,
+            "ocr_used": ocr_used,
+            "skills": skills,
+            "score": score,
+            "details": details,
+            "sections": dict(sections),
+            "ats_score": ats_score,
+            "ats_components": ats_components,
+        })
+        if include_text:
+            record["text"] = resume_text
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+
+    return _finish(record, start, diag)
+
+
+def _finish(record: Dict, start: float, diag: Optional[Diagnostics]) -> Dict:
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    if diag is not None:
+        record["diagnostics"] = diag.to_dict()
+    return record
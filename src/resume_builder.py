@@ -1,69 +1,63 @@
 # src/resume_builder.py
+import os
+import string
+from typing import Dict, Iterable, List, Optional, Tuple
 
-def build_resume_template(sections, skills, style="Modern"):
-    """
-    Build a resume template using detected sections + skills.
-    Supports multiple styles: Modern, Minimal, ATS-friendly.
-    """
-    summary = sections.get("Summary", "")
-    projects = sections.get("Projects", "")
-    education = sections.get("Education", "")
-    achievements = sections.get("Achievements", "")
-    skills_list = ", ".join(skills) if skills else "Add your main skills here"
+from zipstream import ZipStreamWriter
+
+STYLES = ("Modern", "Minimal", "ATS-friendly")
 
-    if style == "Minimal":
-        return f"""
+# Template text per style; {field} is filled from the detected sections,
+# or from the style's placeholder text below when that section is empty.
+_TEMPLATES = {
+    "Minimal": """
 FULL NAME
 Email | Phone | City
 
 SUMMARY
-{summary or "Write a short 2–3 line summary here."}
+{summary}
 
 SKILLS
-{skills_list}
+{skills}
 
 PROJECTS
-{projects or "List 2–3 key projects with one line each."}
+{projects}
 
 EDUCATION
-{education or "Add your degree, college, and year of passing."}
+{education}
 
 ACHIEVEMENTS
-{achievements or "Mention certifications, awards, or hackathons here."}
-""".strip()
-
-    if style == "ATS-friendly":
-        return f"""
+{achievements}
+""",
+    "ATS-friendly": """
 FULL NAME
 Email: your.email@example.com
 Phone: +91 XXXXX XXXXX
 LinkedIn: https://linkedin.com/in/yourprofile
 
 SUMMARY:
-{summary or "Results-driven student/professional with skills in <your domain>."}
+{summary}
 
 SKILLS:
-{skills_list}
+{skills}
 
 EXPERIENCE:
 - Add job/internship title | Company | Dates
   - Use bullet points with action verbs and measurable impact.
 
 PROJECTS:
-{projects or "- Add 2–4 projects, each with tech stack and what you built."}
+{projects}
 
 EDUCATION:
-{education or "- Degree | College | Year | CGPA"}
+{education}
 
 ACHIEVEMENTS:
-{achievements or "- Add certifications, awards, competitive exams, etc."}
+{achievements}
 
 DECLARATION:
 I hereby declare that the information furnished above is true to the best of my knowledge.
-""".strip()
-
-    # Default: Modern
-    return f"""
+""",
+    "Modern": """
 =============================================
                MODERN RESUME
 =============================================
@@ -77,27 +71,27 @@ GitHub: github.com/yourgithub
 ---------------------------------------------
 SUMMARY
 ---------------------------------------------
-{summary or "Write a 3–4 line summary describing your strengths, skills, and goals."}
+{summary}
 
 ---------------------------------------------
 SKILLS
 ---------------------------------------------
-{skills_list}
+{skills}
 
 ---------------------------------------------
 PROJECTS
 ---------------------------------------------
-{projects or "Add your top 2–4 projects here with impact & responsibilities."}
+{projects}
 
 ---------------------------------------------
 EDUCATION
 ---------------------------------------------
-{education or "Add your school/college details here."}
+{education}
 
 ---------------------------------------------
 ACHIEVEMENTS
 ---------------------------------------------
-{achievements or "Add certificates, awards, hackathons, etc."}
+{achievements}
 
 ---------------------------------------------
 EXPERIENCE (OPTIONAL)
@@ -110,4 +104,112 @@ DECLARATION
 I hereby declare that all the information provided above is true to the best of my knowledge.
 
 =============================================
-""".strip()
+""",
+}
+
+_PLACEHOLDERS = {
+    "Minimal": {
+        "summary": "Write a short 2–3 line summary here.",
+        "projects": "List 2–3 key projects with one line each.",
+        "education": "Add your degree, college, and year of passing.",
+        "achievements": "Mention certifications, awards, or hackathons here.",
+    },
+    "ATS-friendly": {
+        "summary": "Results-driven student/professional with skills in <your domain>.",
+        "projects": "- Add 2–4 projects, each with tech stack and what you built.",
+        "education": "- Degree | College | Year | CGPA",
+        "achievements": "- Add certifications, awards, competitive exams, etc.",
+    },
+    "Modern": {
+        "summary": "Write a 3–4 line summary describing your strengths, skills, and goals.",
+        "projects": "Add your top 2–4 projects here with impact & responsibilities.",
+        "education": "Add your school/college details here.",
+        "achievements": "Add certificates, awards, hackathons, etc.",
+    },
+}
+
+_SECTION_FIELDS = {
+    "summary": "Summary",
+    "projects": "Projects",
+    "education": "Education",
+    "achievements": "Achievements",
+}
+
+
+def _compile(style: str) -> Tuple[List[Optional[str]], Tuple[Tuple[int, Optional[str], Optional[str]], ...]]:
+    """
+    Parse a style's template once into a list of literal text with empty
+    slots, plus (slot index, section name, placeholder) for each slot; the
+    skills slot has no section name.
+    """
+    layout: List[Optional[str]] = []
+    slots = []
+    for literal, field, _, _ in string.Formatter().parse(_TEMPLATES[style]):
+        layout.append(literal)
+        if field is not None:
+            slots.append((len(layout), _SECTION_FIELDS.get(field), _PLACEHOLDERS[style].get(field)))
+            layout.append(None)
+    return layout, tuple(slots)
+
+
+_COMPILED = {style: _compile(style) for style in _TEMPLATES}
+
+
+def build_resume_template(sections, skills, style="Modern"):
+    """
+    Build a resume template using detected sections + skills.
+    Supports multiple styles: Modern, Minimal, ATS-friendly.
+    """
+    layout, slots = _COMPILED.get(style) or _COMPILED["Modern"]
+    skills_list = ", ".join(skills) if skills else "Add your main skills here"
+
+    parts = layout.copy()
+    for i, name, placeholder in slots:
+        parts[i] = (sections.get(name, "") or placeholder) if name else skills_list
+    return "".join(parts).strip()  # also trims a section value that ends the template
+
+
+def template_filename(style: str) -> str:
+    return f"generated_resume_{style.lower().replace(' ', '_')}.txt"
+
+
+def export_templates(results: Iterable, dest, styles: Iterable[str] = STYLES,
+                     compresslevel: int = 6) -> int:
+    """
+    Write templates for every result into a ZIP archive, one entry at a time,
+    so memory does not grow with the number of resumes.
+
+    results: (sections, skills) or (name, sections, skills) items; entries are
+             "<n>_<name>/generated_resume_<style>.txt", numbered in input order
+             (so equal file names from different folders never collide).
+    dest:    path or binary file object; it need not be seekable (e.g. stdout).
+    Returns the number of resumes written.
+    """
+    styles = list(styles)
+    count = 0
+    with ZipStreamWriter(dest, compresslevel=compresslevel) as archive:
+        for item in results:
+            if len(item) == 2:
+                name, (sections, skills) = None, item
+            else:
+                name, sections, skills = item
+            count += 1
+            folder = f"{count:05d}_{_folder_name(name) or 'resume'}"
+            for style in styles:
+                text = build_resume_template(sections, skills, style=style)
+                archive.writestr(f"{folder}/{template_filename(style)}", text.encode("utf-8"))
+    return count
+
+
+def _folder_name(name: Optional[str]) -> str:
+    if not name:
+        return ""
+    stem = os.path.splitext(os.path.basename(name))[0]
+    return "".join(c if c.isalnum() or c in "-_. " else "_" for c in stem).strip(" .")
+
+
+def iter_template_inputs(records: Iterable[Dict]) -> Iterable[Tuple[str, Dict, List[str]]]:
+    """(path, sections, skills) for every analysed batch record."""
+    for record in records:
+        if record.get("ok") and "sections" in record:
+            yield record["path"], record["sections"], record.get("skills", [])
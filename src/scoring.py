@@ -0,0 +1,94 @@
+# src/scoring.py
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+# The scoring rules of nlp.analyze_resume_text and ats.compute_ats_breakdown.
+# With these defaults score_batch reproduces them exactly; pass `weights` to
+# re-weight an archive without re-processing it.
+DEFAULT_WEIGHTS = {
+    # resume score
+    "base": 20, "per_skill": 4, "max_score": 100,
+    "short_words": 80, "short_penalty": 10, "short_floor": 30,
+    "resume_weight": 0.7, "jd_weight": 0.3,
+    # ATS components
+    "skill_points": 5, "skills_cap": 40,
+    "keywords_cap": 30,
+    "section_points": 4, "structure_cap": 20,
+    "ideal_words": (120, 450), "ok_words": (80, 600),
+    "length_ideal": 10, "length_ok": 6, "length_poor": 2,
+    "ats_cap": 100,
+}
+
+FEATURES = ["word_count", "num_skills", "jd_match", "num_sections", "has_jd"]
+
+
+def score_batch(word_count, num_skills, jd_match, num_sections, has_jd=None,
+                weights: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+    """
+    Score many resumes at once from columnar features (array-likes of equal length):
+      word_count, num_skills    - details["word_count"], details["num_skills"]
+      jd_match                  - details["jd_match_score"]
+      num_sections              - sections with non-empty content
+      has_jd                    - whether a job description was given (default: all False)
+    Category counts do not enter any score, so they are not needed here.
+
+    Returns int64 arrays: "score" (resume score), "ats_score" and the ATS
+    components "Skills", "Keywords", "Structure", "Length".
+    """
+    w = {**DEFAULT_WEIGHTS, **(weights or {})}
+    words = np.asarray(word_count, dtype=np.int64)
+    skills = np.asarray(num_skills, dtype=np.int64)
+    jd = np.asarray(jd_match, dtype=np.int64)
+    sections = np.asarray(num_sections, dtype=np.int64)
+    with_jd = np.zeros(words.shape, dtype=bool) if has_jd is None else np.asarray(has_jd, dtype=bool)
+
+    # resume score (nlp.analyze_resume_text)
+    score = np.minimum(w["max_score"], w["base"] + skills * w["per_skill"])
+    short = words < w["short_words"]
+    score = np.where(short, np.maximum(w["short_floor"], score - w["short_penalty"]), score)
+    # np.rint rounds half to even, like Python's round()
+    blended = np.rint(score * w["resume_weight"] + jd * w["jd_weight"]).astype(np.int64)
+    score = np.where(with_jd, blended, score)
+
+    # ATS breakdown (ats.compute_ats_breakdown)
+    skills_score = np.minimum(skills * w["skill_points"], w["skills_cap"])
+    keyword_score = np.minimum(jd, w["keywords_cap"])
+    structure_score = np.minimum(sections * w["section_points"], w["structure_cap"])
+
+    ideal_lo, ideal_hi = w["ideal_words"]
+    ok_lo, ok_hi = w["ok_words"]
+    ideal = (words >= ideal_lo) & (words <= ideal_hi)
+    ok = ((words >= ok_lo) & (words < ideal_lo)) | ((words > ideal_hi) & (words <= ok_hi))
+    length_score = np.select([ideal, ok], [w["length_ideal"], w["length_ok"]], w["length_poor"])
+
+    total = np.minimum(skills_score + keyword_score + structure_score + length_score, w["ats_cap"])
+
+    return {
+        "score": score.astype(np.int64),
+        "ats_score": total.astype(np.int64),
+        "Skills": skills_score.astype(np.int64),
+        "Keywords": keyword_score.astype(np.int64),
+        "Structure": structure_score.astype(np.int64),
+        "Length": length_score.astype(np.int64),
+    }
+
+
+def features_from_records(records: Iterable[Dict]) -> Dict[str, np.ndarray]:
+    """Feature columns from batch.py / pipeline.analyze_pdf records (failed and duplicate ones skipped)."""
+    columns = {name: [] for name in FEATURES}
+    for record in records:
+        if not record.get("ok") or "details" not in record:
+            continue
+        details = record["details"]
+        columns["word_count"].append(details.get("word_count", 0))
+        columns["num_skills"].append(details.get("num_skills", 0))
+        columns["jd_match"].append(details.get("jd_match_score", 0))
+        columns["num_sections"].append(
+            sum(1 for content in record.get("sections", {}).values() if content.strip())
+        )
+        columns["has_jd"].append(bool(record.get("has_job_description", False)))
+    return {
+        name: np.asarray(values, dtype=bool if name == "has_jd" else np.int64)
+        for name, values in columns.items()
+    }
@@ -1,4 +1,9 @@
 import re
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple, Union
+
+if TYPE_CHECKING:
+    from document import Document
 
 SECTION_PATTERNS = {
     "Summary": r"(summary|objective)",
@@ -8,35 +13,120 @@ SECTION_PATTERNS = {
     "Achievements": r"(achievements|awards|certifications)",
 }
 
-def detect_sections(text: str):
+Span = Tuple[int, int]
+
+
+def _keyword_map() -> Dict[str, str]:
+    """header keyword (lowercase) -> section name, read from SECTION_PATTERNS."""
+    keywords = {}
+    for name, pattern in SECTION_PATTERNS.items():
+        for keyword in pattern.strip("()").split("|"):
+            keywords.setdefault(keyword.lower(), name)
+    return keywords
+
+
+def _compile_header_re(keywords) -> "re.Pattern":
+    # longest first so "technical skills" wins over "skills"
+    alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+    return re.compile(
+        r"^[ \t]*"
+        r"(?:(?:\d{1,2}|[ivx]{1,4})[.)][ \t]*)?"             # list numbering: "1.", "2)", "IV."
+        r"(?P<prefix>(?:[A-Za-z&]+[ \t]+){0,2}?)"          # e.g. "Professional", "Key"
+        rf"(?P<keyword>{alternation})s?"                    # "Internships", "Qualifications"
+        r"(?P<tail>[ \t]*(?:&|and\b|/)[ \t]*[A-Za-z]+(?:[ \t]+[A-Za-z]+){0,2})?"  # "& Tools"
+        r"(?:[ \t]*\((?:cont|contd|continued)\.?\))?"       # repeated on the next page
+        r"[ \t]*(?:[:|\-][ \t]*|$)",                         # "Skills: ..." or a header line
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+
+_KEYWORDS = _keyword_map()
+_HEADER_RE = _compile_header_re(_KEYWORDS)
+# Only used for text without line breaks: first whole-word occurrence of each keyword
+_INLINE_RE = re.compile(
+    r"\b(?P<keyword>" + "|".join(re.escape(k) for k in sorted(_KEYWORDS, key=len, reverse=True)) + r")s?\b",
+    re.IGNORECASE,
+)
+# Small words a title-cased heading leaves in lowercase ("Skills and Tools")
+_HEADING_CONNECTORS = {"&", "/", "and", "of", "the", "for", "in"}
+
+
+class Sections(Mapping):
     """
-    Detect major sections of a resume using regex.
-    Returns a dictionary: {section_name: content}
+    Read-only {section name: content} mapping backed by offsets into the
+    original text. `spans[name]` lists the (start, end) content ranges of that
+    section (more than one if its header repeats); the content string is only
+    built, with whitespace flattened, when a section is first read.
     """
-    clean = text.replace("\n", " ")
-    clean = re.sub(r"\s{2,}", " ", clean)
 
-    sections_found = {}
-    matches = []
+    def __init__(self, text: str, spans: Dict[str, List[Span]]):
+        self.text = text
+        self.spans = spans
+        self._content: Dict[str, str] = {}
 
-    # find section headers
-    for name, pattern in SECTION_PATTERNS.items():
-        match = re.search(pattern, clean, re.IGNORECASE)
-        if match:
-            matches.append((name, match.start()))
+    def __getitem__(self, name: str) -> str:
+        content = self._content.get(name)
+        if content is None:
+            spans = self.spans[name]  # KeyError for unknown sections
+            content = " ".join(" ".join(self.text[start:end].split()) for start, end in spans).strip()
+            self._content[name] = content
+        return content
 
-    # if no matches
-    if not matches:
-        return {}
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
 
-    matches.sort(key=lambda x: x[1])
+    def __len__(self) -> int:
+        return len(self.spans)
 
-    # slice text between indexed sections
-    for i in range(len(matches)):
-        name, start = matches[i]
-        end = matches[i + 1][1] if i + 1 < len(matches) else len(clean)
-        content = clean[start:end]
-        content = re.sub(r"(?i)" + SECTION_PATTERNS[name], "", content).strip()
-        sections_found[name] = content
+    def __repr__(self) -> str:
+        return f"Sections({dict(self)!r})"
 
-    return sections_found
+
+def _is_header(match) -> bool:
+    # With leading words ("Strong communication skills") or a trailing phrase
+    # ("Skills and experience gained...") only accept heading-styled lines.
+    # A heading naming several sections ("Education & Certifications") is
+    # filed under its first keyword.
+    if not match.group("prefix") and not match.group("tail"):
+        return True
+    heading = match.group("prefix") + match.group("keyword") + (match.group("tail") or "")
+    if heading.isupper():
+        return True
+    words = heading.replace("&", " & ").replace("/", " / ").split()
+    return all(w[0].isupper() or w.lower() in _HEADING_CONNECTORS for w in words)
+
+
+def find_section_spans(text: str) -> Dict[str, List[Span]]:
+    """
+    One pass over `text`: headers must start a line. Returns
+    {section name: [(content start, content end), ...]} in order of first appearance.
+    """
+    headers = [
+        (_KEYWORDS[m.group("keyword").lower()], m.start(), m.end())
+        for m in _HEADER_RE.finditer(text)
+        if _is_header(m)
+    ]
+
+    if not headers and "\n" not in text.strip():
+        # flattened text: fall back to the first whole-word mention of each section
+        first = {}
+        for m in _INLINE_RE.finditer(text):
+            first.setdefault(_KEYWORDS[m.group("keyword").lower()], (m.start(), m.end()))
+        headers = sorted(((name, s, e) for name, (s, e) in first.items()), key=lambda h: h[1])
+
+    spans: Dict[str, List[Span]] = {}
+    for i, (name, _start, content_start) in enumerate(headers):
+        content_end = headers[i + 1][1] if i + 1 < len(headers) else len(text)
+        spans.setdefault(name, []).append((content_start, content_end))
+    return spans
+
+
+def detect_sections(text: Union[str, "Document"]) -> Sections:
+    """
+    Detect major sections of a resume from their headers.
+    Returns a mapping: {section_name: content}
+    For a Document, its (cached) sections are returned.
+    """
+    if not isinstance(text, str):
+        return text.sections
+    return Sections(text, find_section_spans(text))
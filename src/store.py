@@ -0,0 +1,240 @@
+# src/store.py
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# rows buffered before one bulk transaction
+BATCH_SIZE = 256
+
+# numeric columns kept next to the JSON record, for analytics
+_HISTOGRAM_COLUMNS = {"score", "ats_score", "word_count", "num_skills", "pages", "seconds"}
+
+
+def job_key(job_description: Optional[str]) -> str:
+    """Key of the job description a result was scored against ("" for none)."""
+    if not job_description:
+        return ""
+    return hashlib.sha256(job_description.encode("utf-8")).hexdigest()[:16]
+
+
+class ResultsStore:
+    """
+    On-disk (SQLite) store of batch results keyed by PDF content hash and job
+    description, so an interrupted run can skip finished documents and
+    analytics run without re-extraction.
+
+      files     path -> size, mtime, content hash (checked before a PDF is submitted)
+      results   one row per (content hash, job key): numeric columns + the full record
+      skills    (job key, skill, content hash) rows for frequency queries
+
+    add() buffers records and writes them BATCH_SIZE at a time in one
+    transaction; flush() (or close()) writes the rest. Several processes can
+    read while one writes (WAL journal); readonly=True opens an existing store
+    without write access.
+    """
+
+    def __init__(self, path: str, readonly: bool = False, batch_size: int = BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._pending: List[Tuple[Dict, str, Optional[os.stat_result]]] = []
+
+        if readonly:
+            self._db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            return
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER,
+                mtime_ns INTEGER,
+                content_hash TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS files_content_hash ON files (content_hash);
+            CREATE TABLE IF NOT EXISTS results (
+                content_hash TEXT NOT NULL,
+                job_key TEXT NOT NULL,
+                ok INTEGER NOT NULL,
+                duplicate_of TEXT,
+                ocr_used INTEGER,
+                score REAL,
+                ats_score REAL,
+                word_count INTEGER,
+                num_skills INTEGER,
+                pages INTEGER,
+                seconds REAL,
+                error TEXT,
+                updated REAL NOT NULL,
+                record TEXT NOT NULL,
+                PRIMARY KEY (content_hash, job_key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS results_job_score ON results (job_key, score);
+            CREATE TABLE IF NOT EXISTS skills (
+                job_key TEXT NOT NULL,
+                skill TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                PRIMARY KEY (job_key, skill, content_hash)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._db.commit()
+
+    # ---------- writing ---------- #
+
+    def add(self, record: Dict, key: str, stat: Optional[os.stat_result] = None) -> None:
+        """
+        Queue one pipeline record scored against job key `key`. `stat` is the
+        file's os.stat() from before it was analysed (for is_done()). Records
+        without a "content_hash" (the file could not be read) are not stored;
+        for "from_store" records only the path is.
+        """
+        if record.get("content_hash"):
+            self._pending.append((record, key, stat))
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        now = time.time()
+        files, results, skills, stale = [], [], [], []
+        for record, key, stat in pending:
+            digest = record["content_hash"]
+            files.append((record["path"], stat.st_size if stat else None,
+                          stat.st_mtime_ns if stat else None, digest))
+            if record.get("from_store"):
+                continue  # same bytes under a new path: the stored result stays as it is
+            details = record.get("details") or {}
+            stored = {k: v for k, v in record.items() if k not in ("path", "content_hash")}
+            results.append((
+                digest, key, int(bool(record.get("ok"))), record.get("duplicate_of"),
+                _optional_int(record.get("ocr_used")), record.get("score"), record.get("ats_score"),
+                details.get("word_count"), details.get("num_skills"), record.get("pages"),
+                record.get("seconds"), record.get("error"), now,
+                json.dumps(stored, ensure_ascii=False),
+            ))
+            stale.append((key, digest))
+            skills.extend((key, skill, digest) for skill in record.get("skills") or ())
+
+        with self._db:  # one transaction for the whole batch
+            self._db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", files)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", results
+            )
+            self._db.executemany("DELETE FROM skills WHERE job_key = ? AND content_hash = ?", stale)
+            self._db.executemany("INSERT OR IGNORE INTO skills VALUES (?, ?, ?)", skills)
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_job_key', ?)", (pending[-1][1],)
+            )
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- lookups ---------- #
+
+    def is_done(self, path: str, key: str, stat: os.stat_result) -> bool:
+        """Whether `path`, unchanged since it was stored, has a successful result for job key `key`."""
+        row = self._db.execute(
+            "SELECT r.ok FROM files f JOIN results r ON r.content_hash = f.content_hash AND r.job_key = ?"
+            " WHERE f.path = ? AND f.size = ? AND f.mtime_ns = ?",
+            (key, path, stat.st_size, stat.st_mtime_ns),
+        ).fetchone()
+        return bool(row and row[0])
+
+    def get(self, digest: str, key: str) -> Optional[Dict]:
+        """The stored successful record for these PDF bytes and job key (without "path"), if any."""
+        row = self._db.execute(
+            "SELECT record FROM results WHERE content_hash = ? AND job_key = ? AND ok = 1", (digest, key)
+        ).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        record["content_hash"] = digest
+        return record
+
+    def last_job_key(self) -> str:
+        row = self._db.execute("SELECT value FROM meta WHERE name = 'last_job_key'").fetchone()
+        return row[0] if row else ""
+
+    def records(self, key: str) -> Iterator[Dict]:
+        """Stored records for job key `key`, one per file path (same shape as batch JSONL lines)."""
+        for path, digest, record in self._db.execute(
+            "SELECT f.path, f.content_hash, r.record FROM files f"
+            " JOIN results r ON r.content_hash = f.content_hash AND r.job_key = ? ORDER BY f.path",
+            (key,),
+        ):
+            yield {"path": path, "content_hash": digest, **json.loads(record)}
+
+    # ---------- analytics ---------- #
+
+    def summary(self, key: str) -> Dict:
+        row = self._db.execute(
+            "SELECT COUNT(*), SUM(ok), SUM(ok = 1 AND duplicate_of IS NOT NULL), SUM(ocr_used),"
+            " SUM(pages), AVG(score), AVG(ats_score), AVG(word_count), AVG(seconds)"
+            " FROM results WHERE job_key = ?",
+            (key,),
+        ).fetchone()
+        documents, ok, duplicates, ocr, pages, score, ats, words, seconds = row
+        files = self._db.execute(
+            "SELECT COUNT(*) FROM files f JOIN results r ON r.content_hash = f.content_hash AND r.job_key = ?",
+            (key,),
+        ).fetchone()[0]
+        return {
+            "files": files,
+            "documents": documents,
+            "ok": ok or 0,
+            "failed": documents - (ok or 0),
+            "duplicates": duplicates or 0,
+            "ocr_used": ocr or 0,
+            "pages": pages or 0,
+            "mean_score": _rounded(score),
+            "mean_ats_score": _rounded(ats),
+            "mean_word_count": _rounded(words),
+            "mean_seconds": _rounded(seconds, 4),
+        }
+
+    def histogram(self, column: str, key: str, bins: int = 10,
+                  low: float = 0, high: float = 100) -> List[Dict]:
+        """Counts of analysed documents per equal-width bin of `column` over [low, high]."""
+        if column not in _HISTOGRAM_COLUMNS:
+            raise ValueError(f"unknown column {column!r}; choose from {sorted(_HISTOGRAM_COLUMNS)}")
+        width = (high - low) / bins
+        counts = dict(self._db.execute(
+            f"SELECT MIN(MAX(CAST((({column}) - ?) / ? AS INTEGER), 0), ?), COUNT(*)"
+            f" FROM results WHERE job_key = ? AND {column} IS NOT NULL GROUP BY 1",
+            (low, width, bins - 1, key),
+        ))
+        return [
+            {"from": _rounded(low + i * width), "to": _rounded(low + (i + 1) * width), "count": counts.get(i, 0)}
+            for i in range(bins)
+        ]
+
+    def skill_frequencies(self, key: str, top: int = 20) -> List[Tuple[str, int]]:
+        """Most common detected skills as (skill, documents), most frequent first."""
+        return self._db.execute(
+            "SELECT skill, COUNT(*) AS n FROM skills WHERE job_key = ? GROUP BY skill"
+            " ORDER BY n DESC, skill LIMIT ?",
+            (key, top),
+        ).fetchall()
+
+
+def _optional_int(value):
+    return None if value is None else int(value)
+
+
+def _rounded(value, digits: int = 2):
+    return None if value is None else round(value, digits)
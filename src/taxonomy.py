@@ -0,0 +1,190 @@
+# src/taxonomy.py
+"""
+Skills taxonomy loaded from a data file, with a prebuilt matcher artifact.
+
+Source formats:
+  CSV   header "canonical,category,aliases"; aliases separated by "|"
+  JSON  [{"canonical": ..., "category": ..., "aliases": [...]}, ...]
+        or {"Category": ["skill", ...], ...} (the shape of nlp.CATEGORIES)
+
+Building the matcher for a large taxonomy takes seconds, so the compiled
+automaton is saved next to the source as "<source>.matcher" and memory-mapped
+on later starts. The artifact records the SHA-256 of the source file and is
+rebuilt when that changes (or when the format / Python version differs).
+
+    python src/taxonomy.py skills.csv      # (re)build the artifact ahead of time
+"""
+import csv
+import gc
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from matcher import SkillMatcher
+
+ARTIFACT_MAGIC = b"RSKMATCH"
+ARTIFACT_VERSION = 1
+ARTIFACT_SUFFIX = ".matcher"
+_HEADER_LEN = struct.Struct("<I")
+
+
+class SkillEntry(NamedTuple):
+    canonical: str              # name reported when any of its terms is found
+    category: str
+    aliases: Tuple[str, ...] = ()
+
+
+def _split_aliases(value: str) -> Tuple[str, ...]:
+    return tuple(a.strip() for a in (value or "").split("|") if a.strip())
+
+
+def load_taxonomy(path: str) -> List[SkillEntry]:
+    """Read a CSV or JSON taxonomy file into SkillEntry rows (file order)."""
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return [SkillEntry(skill, category) for category, skills in data.items() for skill in skills]
+        return [
+            SkillEntry(item["canonical"], item.get("category", "Other"), tuple(item.get("aliases", ())))
+            for item in data
+        ]
+
+    entries = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            canonical = (row.get("canonical") or "").strip()
+            if canonical:
+                entries.append(SkillEntry(
+                    canonical,
+                    (row.get("category") or "").strip() or "Other",
+                    _split_aliases(row.get("aliases")),
+                ))
+    return entries
+
+
+def categories_of(entries: List[SkillEntry]) -> Dict[str, List[str]]:
+    """{category: [canonical name, ...]}, the same shape as nlp.CATEGORIES."""
+    categories: Dict[str, List[str]] = {}
+    for entry in entries:
+        categories.setdefault(entry.category, []).append(entry.canonical)
+    return categories
+
+
+def matcher_terms(entries: List[SkillEntry]) -> Iterator[Tuple[str, str, str]]:
+    """(term, canonical, category) for every canonical name and alias; a term keeps its first skill."""
+    seen = set()
+    for entry in entries:
+        for term in (entry.canonical,) + entry.aliases:
+            key = term.lower()
+            if key and key not in seen:
+                seen.add(key)
+                yield key, entry.canonical, entry.category
+
+
+def source_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _expected_header(source_sha256: str) -> Dict:
+    return {
+        "version": ARTIFACT_VERSION,
+        "python": list(sys.version_info[:2]),   # marshal data is version specific
+        "marshal": marshal.version,
+        "source_sha256": source_sha256,
+    }
+
+
+def save_artifact(path: str, source_sha256: str, categories: Dict[str, List[str]],
+                  matcher: SkillMatcher) -> None:
+    """Write the compiled matcher atomically (readers never see a half-written file)."""
+    header = json.dumps(_expected_header(source_sha256)).encode("utf-8")
+    payload = marshal.dumps((categories, matcher.to_state()))
+    tmp = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(ARTIFACT_MAGIC + _HEADER_LEN.pack(len(header)) + header)
+            f.write(payload)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_artifact(path: str, source_sha256: str) -> Optional[Tuple[Dict[str, List[str]], SkillMatcher]]:
+    """(categories, matcher) from an artifact built from this source, else None."""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = len(ARTIFACT_MAGIC) + _HEADER_LEN.size
+            if mapped[:len(ARTIFACT_MAGIC)] != ARTIFACT_MAGIC:
+                return None
+            (header_len,) = _HEADER_LEN.unpack(mapped[len(ARTIFACT_MAGIC):start])
+            header = json.loads(mapped[start:start + header_len])
+            if header != _expected_header(source_sha256):
+                return None
+
+            # hundreds of thousands of small dicts: a GC pass mid-load would dominate the time
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with memoryview(mapped) as view:
+                    categories, state = marshal.loads(view[start + header_len:])
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        return categories, SkillMatcher.from_state(state)
+    except (OSError, ValueError, EOFError, TypeError, struct.error):
+        return None
+
+
+def artifact_path(source: str) -> str:
+    return source + ARTIFACT_SUFFIX
+
+
+def load_compiled_taxonomy(source: str, artifact: Optional[str] = None,
+                           save: bool = True) -> Tuple[Dict[str, List[str]], SkillMatcher]:
+    """
+    (categories, matcher) for a taxonomy file: from its artifact when that is
+    up to date, otherwise built from the source (and saved, unless save=False).
+    """
+    artifact = artifact or artifact_path(source)
+    digest = source_hash(source)
+    loaded = load_artifact(artifact, digest)
+    if loaded is not None:
+        return loaded
+
+    entries = load_taxonomy(source)
+    categories = categories_of(entries)
+    matcher = SkillMatcher(matcher_terms(entries))
+    if save:
+        try:
+            save_artifact(artifact, digest, categories, matcher)
+        except OSError as e:
+            print("Could not save skills matcher artifact:", e, file=sys.stderr)
+    return categories, matcher
+
+
+if __name__ == "__main__":
+    for source in sys.argv[1:]:
+        start = time.perf_counter()
+        entries = load_taxonomy(source)
+        categories = categories_of(entries)
+        matcher = SkillMatcher(matcher_terms(entries))
+        save_artifact(artifact_path(source), source_hash(source), categories, matcher)
+        built = time.perf_counter() - start
+
+        start = time.perf_counter()
+        load_compiled_taxonomy(source, save=False)
+        loaded = time.perf_counter() - start
+        print(f"{source}: {len(entries)} skills, {len(matcher)} terms, {len(categories)} categories; "
+              f"built in {built:.2f}s, artifact loads in {loaded:.2f}s")
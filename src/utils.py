@@ -1,5 +1,8 @@
 # src/utils.py
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from document import Document
+from nlp import CATEGORIES
 
 def badge_for_score(score: int) -> str:
     if score >= 85:
@@ -11,9 +14,11 @@ def badge_for_score(score: int) -> str:
     return "Needs Improvement"
 
 
-def generate_feedback(skills: List[str], score: int, details: Dict) -> str:
+def generate_feedback(skills: List[str], score: int, details: Dict,
+                      document: Optional[Document] = None) -> str:
     """
     Generate human-readable feedback using skills, score, and details.
+    Without a word count in details, the resume's Document (if given) supplies it.
     """
     lines = []
     badge = badge_for_score(score)
@@ -24,17 +29,20 @@ def generate_feedback(skills: List[str], score: int, details: Dict) -> str:
     else:
         lines.append(f"Detected skills: {', '.join(skills)}.")
 
-    word_count = details.get("word_count", 0)
+    word_count = details.get("word_count")
+    if word_count is None:
+        word_count = document.word_count if document is not None else 0
     if word_count < 100:
         lines.append("Your resume seems quite short. Consider adding more details about projects, internships, or responsibilities.")
     elif word_count > 400:
         lines.append("Your resume is fairly long. Try to keep it concise (1 page for students / freshers).")
 
-    # Category-level feedback
+    # Category-level feedback, for the built-in categories only: a skills
+    # taxonomy (RESUME_SKILLS_TAXONOMY) brings its own category names
     cat_counts = details.get("category_counts", {})
-    if cat_counts.get("Technical", 0) == 0:
+    if "Technical" in CATEGORIES and cat_counts.get("Technical", 0) == 0:
         lines.append("I don’t see many technical skills. If you are applying for tech roles, highlight programming languages and tools.")
-    if cat_counts.get("Soft", 0) == 0:
+    if "Soft" in CATEGORIES and cat_counts.get("Soft", 0) == 0:
         lines.append("Try to mention soft skills like teamwork, communication, or problem solving if relevant.")
 
     jd_match_score = details.get("jd_match_score", 0)
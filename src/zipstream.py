@@ -0,0 +1,116 @@
+# src/zipstream.py
+"""
+Write a ZIP archive front to back with constant memory.
+
+zipfile.ZipFile keeps a ZipInfo (~0.5 KB) per entry until close() to write
+the central directory, so memory grows with the number of entries. Here each
+central-directory record is spooled to a temporary file as soon as its entry
+is written. Output is never seeked, so it can be a pipe (stdout) or socket.
+ZIP64 end records are added when an archive passes 65535 entries or 4 GB.
+"""
+import os
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+_END_RECORD64 = struct.Struct("<IQHHIIQQQQ")
+_END_LOCATOR64 = struct.Struct("<IIQI")
+_ZIP64_OFFSET_EXTRA = struct.Struct("<HHQ")
+
+_MAX16 = 0xFFFF
+_MAX32 = 0xFFFFFFFF
+_UTF8_NAME = 1 << 11
+_DEFLATED = 8
+_VERSION = 20
+_VERSION64 = 45
+_MADE_BY_UNIX = 3 << 8
+_FILE_MODE = 0o100644 << 16
+
+
+class ZipStreamWriter:
+    """Deflated entries written with writestr(); use as a context manager or call close()."""
+
+    def __init__(self, dest, compresslevel: int = 6):
+        self._own = isinstance(dest, (str, os.PathLike))
+        self._out = open(dest, "wb") if self._own else dest
+        self._level = compresslevel
+        self._pos = 0
+        self._entries = 0
+        self._central = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+        self._central_size = 0
+
+        t = time.localtime()
+        self._dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+        self._dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+
+    def _write(self, data: bytes) -> None:
+        self._out.write(data)
+        self._pos += len(data)
+
+    def writestr(self, name: str, data: bytes) -> None:
+        compressor = zlib.compressobj(self._level, zlib.DEFLATED, -15)
+        packed = compressor.compress(data) + compressor.flush()
+        if len(data) >= _MAX32 or len(packed) >= _MAX32:
+            raise ValueError(f"{name}: entries of 4 GB or more are not supported")
+        crc = zlib.crc32(data)
+        encoded = name.encode("utf-8")
+        offset = self._pos
+
+        self._write(_LOCAL_HEADER.pack(
+            0x04034B50, _VERSION, _UTF8_NAME, _DEFLATED, self._dos_time, self._dos_date,
+            crc, len(packed), len(data), len(encoded), 0,
+        ))
+        self._write(encoded)
+        self._write(packed)
+
+        extra, version = b"", _VERSION
+        if offset >= _MAX32:
+            extra, version, offset = _ZIP64_OFFSET_EXTRA.pack(1, 8, offset), _VERSION64, _MAX32
+        record = _CENTRAL_HEADER.pack(
+            0x02014B50, _MADE_BY_UNIX | version, version, _UTF8_NAME, _DEFLATED,
+            self._dos_time, self._dos_date, crc, len(packed), len(data),
+            len(encoded), len(extra), 0, 0, 0, _FILE_MODE, offset,
+        ) + encoded + extra
+        self._central.write(record)
+        self._central_size += len(record)
+        self._entries += 1
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def close(self) -> None:
+        if self._central is None:
+            return
+        central_offset = self._pos
+        self._central.seek(0)
+        shutil.copyfileobj(self._central, self._out)
+        self._pos += self._central_size
+        self._central.close()
+        self._central = None
+
+        if self._entries >= _MAX16 or central_offset >= _MAX32 or self._central_size >= _MAX32:
+            end64_offset = self._pos
+            self._write(_END_RECORD64.pack(
+                0x06064B50, _END_RECORD64.size - 12, _MADE_BY_UNIX | _VERSION64, _VERSION64, 0, 0,
+                self._entries, self._entries, self._central_size, central_offset,
+            ))
+            self._write(_END_LOCATOR64.pack(0x07064B50, 0, end64_offset, 1))
+        entries = min(self._entries, _MAX16)
+        self._write(_END_RECORD.pack(
+            0x06054B50, 0, 0, entries, entries,
+            min(self._central_size, _MAX32), min(central_offset, _MAX32), 0,
+        ))
+        self._out.flush()
+        if self._own:
+            self._out.close()
+
+    def __enter__(self) -> "ZipStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()